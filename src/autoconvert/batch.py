@@ -13,8 +13,12 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 import sys
 import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import openpyxl
@@ -33,23 +37,36 @@ from autoconvert.extract_packing import (
     extract_totals,
     validate_merged_weights,
 )
+from autoconvert.logger import flush_log_handlers
 from autoconvert.merge_tracker import MergeTracker
 from autoconvert.models import (
     AppConfig,
     BatchResult,
+    ColumnMapping,
     FileResult,
     InvoiceItem,
     PackingItem,
     PackingTotals,
+    SheetPair,
 )
 from autoconvert.output import write_template
 from autoconvert.sheet_detect import detect_sheets as _detect_sheets
-from autoconvert.transform import clean_po_number, convert_country, convert_currency
+from autoconvert.sheet_snapshot import SheetSnapshot, WorkbookSnapshot
+from autoconvert.transform import transform_invoice_items
 from autoconvert.validate import determine_file_status
 from autoconvert.weight_alloc import allocate_weights
 
 logger = logging.getLogger(__name__)
 
+# Processable input filenames (FR-003): .xlsx/.xls, any case, excluding
+# ~$ lock files and hidden files.
+_INPUT_FILE_RE = re.compile(
+    r"(?!~\$|\.).+\.xlsx?", re.IGNORECASE | re.DOTALL,
+)
+
+# Statuses for which a template output file is written (FR-029).
+_OUTPUT_STATUSES = frozenset({"Success", "Attention"})
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -59,37 +76,51 @@ logger = logging.getLogger(__name__)
 def run_batch(
     config: AppConfig,
     data_dir: Path,
-    diagnostic_file: str | None = None,
+    diagnostic_path: Path | None = None,
+    jobs: int = 1,
+    log_path: Path | None = None,
 ) -> BatchResult:
     """Orchestrate full batch processing of vendor Excel files.
 
     Creates required directories, optionally clears the output directory,
     scans for input files, processes each file independently via
-    ``process_file()``, and returns a BatchResult with all outcomes.
+    ``process_file()``, and returns a BatchResult with all outcomes sorted
+    by filename.
     In diagnostic mode, processes only the specified file without clearing
     the output directory.
 
+    With ``jobs > 1`` files are processed in a process pool. Each worker
+    buffers its log records, which are replayed here in submission order so
+    console and log-file output match a serial run.
+
     Args:
         config: Validated application configuration from config.py.
         data_dir: Path to the data/ directory containing input files.
-        diagnostic_file: Filename or path for single-file diagnostic mode.
-            None for normal batch mode.
+        diagnostic_path: Resolved, existing file path for single-file
+            diagnostic mode (cli.main resolves it). None for normal batch
+            mode.
+        jobs: Maximum number of worker processes. 1 processes serially.
+        log_path: Log file path reported in the BatchResult (cli.main
+            passes the path it configured logging with). Defaults to
+            process_log.txt beside data_dir.
 
     Returns:
         BatchResult with per-file results, counts, and processing time.
     """
     finished_dir = data_dir / "finished"
+    if log_path is None:
+        log_path = data_dir.parent / "process_log.txt"
 
     # FR-001: Create data/ and data/finished/ if they do not exist.
     _create_directories(data_dir, finished_dir)
 
     # FR-028: Clear data/finished/ before processing (skip in diagnostic mode).
-    if diagnostic_file is None:
+    if diagnostic_path is None:
         _clear_finished_directory(finished_dir)
 
     # FR-003: Scan for processable files.
-    if diagnostic_file is not None:
-        files = _resolve_diagnostic_file(diagnostic_file, data_dir)
+    if diagnostic_path is not None:
+        files = [diagnostic_path]
     else:
         files = _scan_input_files(data_dir)
 
@@ -102,49 +133,81 @@ def run_batch(
             failed_count=0,
             processing_time=0.0,
             file_results=[],
-            log_path=str(data_dir.parent / "process_log.txt"),
+            log_path=str(log_path),
         )
 
     # Process each file independently.
-    start_time = time.time()
+    start_time = time.perf_counter()
     file_results: list[FileResult] = []
 
-    for idx, filepath in enumerate(files, start=1):
-        logger.info("-" * 65)
-        logger.info("[%d/%d] Processing: %s ...", idx, len(files), filepath.name)
-        result = process_file(filepath, config)
-        file_results.append(result)
-
-        # Log per-file status.
-        if result.status == "Success":
-            logger.info("\u2705 SUCCESS")
-        elif result.status == "Attention":
-            for w in result.warnings:
-                logger.warning("[%s] %s", w.code, w.message)
-            logger.warning("\u26a0\ufe0f ATTENTION")
-        else:
-            for e in result.errors:
-                logger.error("[%s] %s", e.code, e.message)
-            logger.error("\u274c FAILED")
+    workers = min(jobs, len(files))
+    # Reason: Passing config and finished_dir through the initializer ships
+    # them (compiled regexes and lookup tables included) once per worker,
+    # not once per submitted file.
+    executor = (
+        ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(config, finished_dir),
+        )
+        if workers > 1
+        else None
+    )
+
+    try:
+        futures = (
+            [executor.submit(_process_file_captured, fp) for fp in files]
+            if executor is not None
+            else None
+        )
 
-    processing_time = time.time() - start_time
+        for idx, filepath in enumerate(files, start=1):
+            logger.info("-" * 65)
+            logger.info("[%d/%d] Processing: %s ...", idx, len(files), filepath.name)
+            if futures is None:
+                result = process_file(filepath, config, finished_dir)
+            else:
+                result, records = futures[idx - 1].result()
+                for record in records:
+                    logging.getLogger(record.name).handle(record)
+            file_results.append(result)
+
+            # Log per-file status.
+            if result.status == "Success":
+                logger.info("\u2705 SUCCESS")
+            elif result.status == "Attention":
+                for w in result.warnings:
+                    logger.warning("[%s] %s", w.code, w.message)
+                logger.warning("\u26a0\ufe0f ATTENTION")
+            else:
+                for e in result.errors:
+                    logger.error("[%s] %s", e.code, e.message)
+                logger.error("\u274c FAILED")
+            flush_log_handlers()
+    finally:
+        if executor is not None:
+            # Reason: On an early exit (e.g. Ctrl+C) drop the files still
+            # queued instead of processing them before returning.
+            executor.shutdown(cancel_futures=True)
 
-    success_count = sum(1 for r in file_results if r.status == "Success")
-    attention_count = sum(1 for r in file_results if r.status == "Attention")
-    failed_count = sum(1 for r in file_results if r.status == "Failed")
+    processing_time = time.perf_counter() - start_time
+
+    status_counts = Counter(r.status for r in file_results)
 
     return BatchResult(
         total_files=len(file_results),
-        success_count=success_count,
-        attention_count=attention_count,
-        failed_count=failed_count,
+        success_count=status_counts["Success"],
+        attention_count=status_counts["Attention"],
+        failed_count=status_counts["Failed"],
         processing_time=processing_time,
         file_results=file_results,
-        log_path=str(data_dir.parent / "process_log.txt"),
+        log_path=str(log_path),
     )
 
 
-def process_file(filepath: Path, config: AppConfig) -> FileResult:
+def process_file(
+    filepath: Path, config: AppConfig, finished_dir: Path | None = None,
+) -> FileResult:
     """Process a single vendor Excel file through the full pipeline.
 
     Pipeline phases: sheet detection, column mapping, data extraction,
@@ -154,179 +217,46 @@ def process_file(filepath: Path, config: AppConfig) -> FileResult:
     Args:
         filepath: Absolute path to the input Excel file.
         config: Validated application configuration.
+        finished_dir: Output directory for the template file. run_batch
+            passes data/finished/; defaults to a "finished" directory
+            next to the input file.
 
     Returns:
         FileResult with status, errors, warnings, and extracted data.
     """
-    errors: list[ProcessingError] = []
-    warnings: list[ProcessingError] = []
-    invoice_items: list[InvoiceItem] | None = None
-    packing_items: list[PackingItem] | None = None
-    packing_totals: PackingTotals | None = None
+    ctx = _FileContext(filepath, config)
+    errors = ctx.errors
     status = "Failed"
 
     try:
-        # Phase 1: Open workbook.
-        workbook = _open_workbook(filepath)
-
-        # Phase 2: Sheet detection.
-        try:
-            sheet_pair = _detect_sheets(workbook, config)
-        except ProcessingError as e:
-            e.filename = filepath.name
-            errors.append(e)
-            status = determine_file_status(errors, warnings)
-            return _build_result(
-                filepath, status, errors, warnings, None, None, None,
-            )
-
-        inv_sheet = sheet_pair.invoice_sheet
-        pack_sheet = sheet_pair.packing_sheet
-
-        # Phase 3: Column mapping.
-        phase3_errors: list[ProcessingError] = []
-
-        # 3a/3b: MergeTracker (must happen BEFORE header detection).
-        inv_merge = MergeTracker(inv_sheet)
-        pack_merge = MergeTracker(pack_sheet)
-
-        # 3c/3d: Detect header rows and map columns for invoice.
-        inv_col_map = None
-        try:
-            inv_header_row = detect_header_row(inv_sheet, "invoice", config)
-            inv_col_map = map_columns(inv_sheet, inv_header_row, "invoice", config)
-        except ProcessingError as e:
-            e.filename = filepath.name
-            phase3_errors.append(e)
-
-        # 3e/3f: Detect header rows and map columns for packing.
-        pack_col_map = None
-        try:
-            pack_header_row = detect_header_row(pack_sheet, "packing", config)
-            pack_col_map = map_columns(
-                pack_sheet, pack_header_row, "packing", config,
-            )
-        except ProcessingError as e:
-            e.filename = filepath.name
-            phase3_errors.append(e)
-
-        # 3g: Invoice number fallback.
-        inv_no: str | None = None
-        if inv_col_map is not None:
-            if "inv_no" in inv_col_map.field_map:
-                inv_no = None  # Will be read per-row by extract_invoice_items.
-            else:
-                inv_no = extract_inv_no_from_header(inv_sheet, config)
-                if inv_no is None:
-                    phase3_errors.append(
-                        ProcessingError(
-                            code=ErrorCode.ERR_021,
-                            message=(
-                                "Invoice number not found: neither column "
-                                "mapping nor header area extraction returned "
-                                "a value"
-                            ),
-                            filename=filepath.name,
-                        )
+        # Phases 1-6: stop at the first phase that reports fatal errors;
+        # status stays "Failed" and the shared Failed return below applies.
+        for phase in _PIPELINE:
+            if not _run_phase(phase, ctx):
+                break
+        else:
+            # Phase 7: Validation.
+            status = determine_file_status(errors, ctx.warnings)
+
+            # Phase 8: Output.
+            if status in _OUTPUT_STATUSES:
+                if finished_dir is None:
+                    finished_dir = filepath.parent / "finished"
+                output_path = finished_dir / f"{filepath.stem}_template.xlsx"
+                assert ctx.invoice_items is not None
+                assert ctx.packing_totals is not None
+                try:
+                    write_template(
+                        ctx.invoice_items, ctx.packing_totals, config, output_path,
                     )
-                else:
                     logger.info(
-                        "Inv_No extracted (header): %s", inv_no,
+                        "Output successfully written to: %s_template.xlsx",
+                        filepath.stem,
                     )
-
-        if phase3_errors:
-            errors.extend(phase3_errors)
-            status = determine_file_status(errors, warnings)
-            return _build_result(
-                filepath, status, errors, warnings, None, None, None,
-            )
-
-        # Guaranteed non-None after Phase 3 success.
-        assert inv_col_map is not None
-        assert pack_col_map is not None
-
-        # Phase 4: Extraction.
-        try:
-            # 4a: Extract invoice items.
-            invoice_items = extract_invoice_items(
-                inv_sheet, inv_col_map, inv_merge, inv_no,
-            )
-
-            # 4b: Extract packing items.
-            packing_items_raw, last_data_row = extract_packing_items(
-                pack_sheet, pack_col_map, pack_merge,
-            )
-            packing_items = packing_items_raw
-
-            # 4c: Validate merged weights.
-            validate_merged_weights(packing_items_raw, pack_merge, pack_col_map)
-
-            # 4d: Detect total row.
-            total_row = detect_total_row(
-                pack_sheet, last_data_row, pack_col_map, pack_merge,
-            )
-
-            # 4e: Extract totals.
-            packing_totals, totals_warnings = extract_totals(
-                pack_sheet, total_row, pack_col_map,
-            )
-            warnings.extend(totals_warnings)
-        except ProcessingError as e:
-            e.filename = filepath.name
-            errors.append(e)
-            status = determine_file_status(errors, warnings)
-            return _build_result(
-                filepath, status, errors, warnings,
-                invoice_items, packing_items, packing_totals,
-            )
-
-        # Phase 5: Transformation.
-        assert invoice_items is not None
-
-        # 5a: Convert currency.
-        invoice_items, currency_warnings = convert_currency(invoice_items, config)
-        warnings.extend(currency_warnings)
-
-        # 5b: Convert country.
-        invoice_items, coo_warnings = convert_country(invoice_items, config)
-        warnings.extend(coo_warnings)
-
-        # 5c: Clean PO numbers.
-        invoice_items = clean_po_number(invoice_items)
-
-        # Phase 6: Weight allocation.
-        assert packing_items is not None
-        assert packing_totals is not None
-        try:
-            invoice_items = allocate_weights(
-                invoice_items, packing_items, packing_totals,
-            )
-        except ProcessingError as e:
-            e.filename = filepath.name
-            errors.append(e)
-            status = determine_file_status(errors, warnings)
-            return _build_result(
-                filepath, status, errors, warnings,
-                invoice_items, packing_items, packing_totals,
-            )
-
-        # Phase 7: Validation.
-        status = determine_file_status(errors, warnings)
-
-        # Phase 8: Output.
-        if status in ("Success", "Attention"):
-            finished_dir = filepath.parent / "finished"
-            output_path = finished_dir / f"{filepath.stem}_template.xlsx"
-            try:
-                write_template(invoice_items, packing_totals, config, output_path)
-                logger.info(
-                    "Output successfully written to: %s_template.xlsx",
-                    filepath.stem,
-                )
-            except ProcessingError as e:
-                e.filename = filepath.name
-                errors.append(e)
-                status = determine_file_status(errors, warnings)
+                except ProcessingError as e:
+                    e.filename = filepath.name
+                    errors.append(e)
+                    status = determine_file_status(errors, ctx.warnings)
 
     except PermissionError:
         errors.append(
@@ -357,30 +287,345 @@ def process_file(filepath: Path, config: AppConfig) -> FileResult:
         )
         status = "Failed"
 
+    if status == "Failed":
+        # Reason: Failed results carry no data; drop the extracted lists
+        # here so they are freed before the next file is opened.
+        return _build_result(
+            filepath, status, errors, ctx.warnings, None, None, None,
+        )
+
     return _build_result(
-        filepath, status, errors, warnings,
-        invoice_items if status != "Failed" else None,
-        packing_items if status != "Failed" else None,
-        packing_totals if status != "Failed" else None,
+        filepath, status, errors, ctx.warnings,
+        ctx.invoice_items, ctx.packing_items, ctx.packing_totals,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Pipeline phases
+# ---------------------------------------------------------------------------
+
+
+class _FileContext:
+    """Mutable state threaded through the pipeline phases for one file.
+
+    Attributes:
+        filepath: Path to the input file.
+        config: Validated application configuration.
+        errors: Errors collected so far.
+        warnings: Warnings collected so far.
+        sheet_pair: Detected sheets; released after extraction.
+        inv_merge: MergeTracker for the invoice sheet.
+        pack_merge: MergeTracker for the packing sheet.
+        inv_col_map: Invoice column mapping.
+        pack_col_map: Packing column mapping.
+        inv_no: Header-area invoice number, or None when read per row.
+        invoice_items: Extracted (later transformed) invoice items.
+        packing_items: Extracted packing items.
+        packing_totals: Extracted packing totals.
+    """
+
+    def __init__(self, filepath: Path, config: AppConfig) -> None:
+        """Initialize empty state for one file.
+
+        Args:
+            filepath: Path to the input file.
+            config: Validated application configuration.
+        """
+        self.filepath = filepath
+        self.config = config
+        self.errors: list[ProcessingError] = []
+        self.warnings: list[ProcessingError] = []
+        self.sheet_pair: SheetPair | None = None
+        self.inv_merge: MergeTracker | None = None
+        self.pack_merge: MergeTracker | None = None
+        self.inv_col_map: ColumnMapping | None = None
+        self.pack_col_map: ColumnMapping | None = None
+        self.inv_no: str | None = None
+        self.invoice_items: list[InvoiceItem] | None = None
+        self.packing_items: list[PackingItem] | None = None
+        self.packing_totals: PackingTotals | None = None
+
+
+def _run_phase(
+    phase: Callable[[_FileContext], list[ProcessingError]],
+    ctx: _FileContext,
+) -> bool:
+    """Run one pipeline phase and record any fatal errors it reports.
+
+    A phase reports failure either by returning a non-empty error list or
+    by raising ProcessingError. Errors are tagged with the filename and
+    appended to ``ctx.errors``.
+
+    Args:
+        phase: Phase function taking the file context.
+        ctx: Per-file pipeline state.
+
+    Returns:
+        True if the phase succeeded and the pipeline should continue.
+    """
+    try:
+        phase_errors = phase(ctx)
+    except ProcessingError as e:
+        phase_errors = [e]
+
+    for err in phase_errors:
+        err.filename = ctx.filepath.name
+    ctx.errors.extend(phase_errors)
+    return not phase_errors
+
+
+def _phase_detect_sheets(ctx: _FileContext) -> list[ProcessingError]:
+    """Phases 1-2: open the workbook and detect invoice/packing sheets.
+
+    Args:
+        ctx: Per-file pipeline state; sets ``sheet_pair``.
+
+    Returns:
+        Empty list (failures raise ProcessingError).
+    """
+    ctx.sheet_pair = _detect_sheets(_open_workbook(ctx.filepath), ctx.config)
+    return []
+
+
+def _phase_map_columns(ctx: _FileContext) -> list[ProcessingError]:
+    """Phase 3: track merges, map columns, and resolve the invoice number.
+
+    Both sheets are always attempted so that all mapping errors for the
+    file are reported together.
+
+    Args:
+        ctx: Per-file pipeline state; sets merge trackers, column maps,
+            and ``inv_no``.
+
+    Returns:
+        All column-mapping errors, plus ERR_021 if no invoice number
+        source was found.
+    """
+    assert ctx.sheet_pair is not None
+    inv_sheet = ctx.sheet_pair.invoice_sheet
+    pack_sheet = ctx.sheet_pair.packing_sheet
+    config = ctx.config
+    phase_errors: list[ProcessingError] = []
+
+    # 3a/3b: MergeTracker (must happen BEFORE header detection).
+    ctx.inv_merge = MergeTracker(inv_sheet)
+    ctx.pack_merge = MergeTracker(pack_sheet)
+
+    # 3c/3d: Detect header rows and map columns for invoice.
+    try:
+        inv_header_row = detect_header_row(inv_sheet, "invoice", config)
+        ctx.inv_col_map = map_columns(inv_sheet, inv_header_row, "invoice", config)
+    except ProcessingError as e:
+        phase_errors.append(e)
+
+    # 3e/3f: Detect header rows and map columns for packing.
+    try:
+        pack_header_row = detect_header_row(pack_sheet, "packing", config)
+        ctx.pack_col_map = map_columns(
+            pack_sheet, pack_header_row, "packing", config,
+        )
+    except ProcessingError as e:
+        phase_errors.append(e)
+
+    # 3g: Invoice number fallback.
+    # (inv_no stays None when mapped: extract_invoice_items reads it per row.)
+    if ctx.inv_col_map is not None and "inv_no" not in ctx.inv_col_map.field_map:
+        ctx.inv_no = extract_inv_no_from_header(inv_sheet, config)
+        if ctx.inv_no is None:
+            phase_errors.append(
+                ProcessingError(
+                    code=ErrorCode.ERR_021,
+                    message=(
+                        "Invoice number not found: neither column "
+                        "mapping nor header area extraction returned "
+                        "a value"
+                    ),
+                )
+            )
+        else:
+            logger.info("Inv_No extracted (header): %s", ctx.inv_no)
+
+    return phase_errors
+
+
+def _phase_extract(ctx: _FileContext) -> list[ProcessingError]:
+    """Phase 4: extract invoice items, packing items, and packing totals.
+
+    Results are stored on ``ctx`` as soon as each step completes, so a
+    failure in a later step still reports the data extracted before it.
+
+    Args:
+        ctx: Per-file pipeline state; sets the item lists and totals.
+
+    Returns:
+        Empty list (failures raise ProcessingError).
+    """
+    assert ctx.sheet_pair is not None
+    assert ctx.inv_col_map is not None and ctx.pack_col_map is not None
+    assert ctx.inv_merge is not None and ctx.pack_merge is not None
+    pack_sheet = ctx.sheet_pair.packing_sheet
+
+    # 4a: Extract invoice items.
+    ctx.invoice_items = extract_invoice_items(
+        ctx.sheet_pair.invoice_sheet, ctx.inv_col_map, ctx.inv_merge, ctx.inv_no,
+    )
+
+    # 4b: Extract packing items.
+    ctx.packing_items, last_data_row = extract_packing_items(
+        pack_sheet, ctx.pack_col_map, ctx.pack_merge,
     )
 
+    # 4c: Validate merged weights.
+    validate_merged_weights(ctx.packing_items, ctx.pack_merge, ctx.pack_col_map)
+
+    # 4d: Detect total row.
+    total_row = detect_total_row(
+        pack_sheet, last_data_row, ctx.pack_col_map, ctx.pack_merge,
+    )
+
+    # 4e: Extract totals.
+    ctx.packing_totals, totals_warnings = extract_totals(
+        pack_sheet, total_row, ctx.pack_col_map,
+    )
+    ctx.warnings.extend(totals_warnings)
+
+    # Reason: Extraction is the last reader of the sheets; release the
+    # snapshots now rather than holding them through output writing.
+    ctx.sheet_pair = None
+    return []
+
+
+def _phase_transform(ctx: _FileContext) -> list[ProcessingError]:
+    """Phase 5: convert currency and country, clean PO numbers (one pass).
+
+    Args:
+        ctx: Per-file pipeline state; replaces ``invoice_items``.
+
+    Returns:
+        Empty list (unmatched lookups are warnings, not errors).
+    """
+    assert ctx.invoice_items is not None
+    ctx.invoice_items, transform_warnings = transform_invoice_items(
+        ctx.invoice_items, ctx.config,
+    )
+    ctx.warnings.extend(transform_warnings)
+    return []
+
+
+def _phase_allocate_weights(ctx: _FileContext) -> list[ProcessingError]:
+    """Phase 6: allocate packing net weights onto invoice items.
+
+    Args:
+        ctx: Per-file pipeline state; replaces ``invoice_items``.
+
+    Returns:
+        Empty list (failures raise ProcessingError).
+    """
+    assert ctx.invoice_items is not None
+    assert ctx.packing_items is not None and ctx.packing_totals is not None
+    ctx.invoice_items = allocate_weights(
+        ctx.invoice_items, ctx.packing_items, ctx.packing_totals,
+    )
+    return []
+
+
+# Phases 1-6 in execution order; process_file runs validation and output.
+_PIPELINE: tuple[Callable[[_FileContext], list[ProcessingError]], ...] = (
+    _phase_detect_sheets,
+    _phase_map_columns,
+    _phase_extract,
+    _phase_transform,
+    _phase_allocate_weights,
+)
+
 
 # ---------------------------------------------------------------------------
 # Private helpers
 # ---------------------------------------------------------------------------
 
 
-def _open_workbook(filepath: Path) -> openpyxl.Workbook:
+class _RecordBuffer(logging.Handler):
+    """Logging handler that collects records for transfer to the parent.
+
+    Attributes:
+        records: Captured records, already formatted into plain messages.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer accepting all levels."""
+        super().__init__(logging.DEBUG)
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Store a record with its message pre-rendered.
+
+        Args:
+            record: The log record to buffer.
+        """
+        # Reason: args may hold unpicklable objects; render the message now
+        # so the record crosses the process boundary safely.
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
+
+
+# Per-process (config, finished_dir) installed by _init_worker in pool workers.
+_worker_args: tuple[AppConfig, Path] | None = None
+
+
+def _init_worker(config: AppConfig, finished_dir: Path) -> None:
+    """Store the batch-wide arguments in a pool worker process.
+
+    Args:
+        config: Validated application configuration.
+        finished_dir: Output directory for the template file.
+    """
+    global _worker_args
+    _worker_args = (config, finished_dir)
+
+
+def _process_file_captured(
+    filepath: Path,
+) -> tuple[FileResult, list[logging.LogRecord]]:
+    """Run process_file in a pool worker, capturing its log records.
+
+    Uses the config and output directory installed by _init_worker.
+
+    Args:
+        filepath: Absolute path to the input Excel file.
+
+    Returns:
+        Tuple of (FileResult, log records emitted while processing).
+    """
+    assert _worker_args is not None, "pool worker not initialized"
+    config, finished_dir = _worker_args
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    buffer = _RecordBuffer()
+    root.handlers = [buffer]
+    root.setLevel(logging.DEBUG)
+    try:
+        result = process_file(filepath, config, finished_dir)
+    finally:
+        root.handlers = saved_handlers
+        root.setLevel(saved_level)
+    return result, buffer.records
+
+
+def _open_workbook(filepath: Path) -> WorkbookSnapshot:
     """Open an Excel workbook, dispatching by extension.
 
-    For .xlsx: uses openpyxl with data_only=True, read_only=False.
-    For .xls: uses xlrd with the XlrdSheetAdapter wrapper.
+    For .xlsx: uses openpyxl with data_only=True, read_only=True and
+    materializes every worksheet into a SheetSnapshot before closing the
+    file, so no archive handle outlives this call.
+    For .xls: uses xlrd, materialized into the same SheetSnapshot form.
 
     Args:
         filepath: Path to the Excel file.
 
     Returns:
-        openpyxl Workbook (or an adapter wrapping xlrd).
+        WorkbookSnapshot holding one SheetSnapshot per worksheet.
 
     Raises:
         PermissionError: If the file is locked (ERR_010).
@@ -392,54 +637,41 @@ def _open_workbook(filepath: Path) -> openpyxl.Workbook:
         return _open_xls_workbook(filepath)
 
     # Default: .xlsx
-    return openpyxl.load_workbook(filepath, data_only=True, read_only=False)
-
+    wb = openpyxl.load_workbook(
+        filepath, data_only=True, read_only=True, keep_links=False,
+    )
+    try:
+        return WorkbookSnapshot(
+            [SheetSnapshot.from_read_only(ws) for ws in wb.worksheets]
+        )
+    finally:
+        wb.close()
 
-def _open_xls_workbook(filepath: Path) -> openpyxl.Workbook:
-    """Open a .xls file via xlrd and wrap sheets in adapters.
 
-    Creates an openpyxl-compatible Workbook-like object by wrapping
-    each xlrd sheet in an XlrdSheetAdapter.
+def _open_xls_workbook(filepath: Path) -> WorkbookSnapshot:
+    """Open a .xls file via xlrd and materialize sheets as snapshots.
 
     Args:
         filepath: Path to the .xls file.
 
     Returns:
-        An openpyxl Workbook with adapted sheets.
+        WorkbookSnapshot holding one SheetSnapshot per xlrd sheet.
 
     Raises:
         PermissionError: If the file is locked.
     """
     import xlrd  # type: ignore[import-untyped]
 
-    from autoconvert.xlrd_adapter import XlrdSheetAdapter
-
     try:
         xls_book = xlrd.open_workbook(str(filepath))
     except xlrd.XLRDError as e:  # type: ignore[attr-defined]
         raise InvalidFileException(str(e)) from e
 
-    # Build an openpyxl Workbook and replace sheets with adapters.
-    wb = openpyxl.Workbook()
-
-    # Remove default sheet.
-    default = wb.active
-    if default is not None:
-        wb.remove(default)
-
-    for sheet_idx in range(xls_book.nsheets):
-        xls_sheet = xls_book.sheet_by_index(sheet_idx)
-        adapter = XlrdSheetAdapter(xls_sheet)
-
-        # Create an openpyxl sheet placeholder for the adapter.
-        wb.create_sheet(title=xls_sheet.name)
-
-        # Reason: Replace the openpyxl worksheet with our adapter in the
-        # workbook's internal mapping. detect_sheets uses workbook[name].
-        wb._sheets[wb.sheetnames.index(xls_sheet.name)] = adapter  # type: ignore[assignment]
-
-    logger.debug("Opened .xls file via xlrd adapter: %s", filepath.name)
-    return wb
+    snapshot = WorkbookSnapshot(
+        [SheetSnapshot.from_xlrd(sheet) for sheet in xls_book.sheets()]
+    )
+    logger.debug("Opened .xls file via xlrd snapshot: %s", filepath.name)
+    return snapshot
 
 
 def _create_directories(data_dir: Path, finished_dir: Path) -> None:
@@ -468,10 +700,13 @@ def _clear_finished_directory(finished_dir: Path) -> None:
     if not finished_dir.exists():
         return
 
+    # Reason: rmtree would also drop subdirectories; scandir keeps them and
+    # DirEntry.is_file() avoids a stat call per entry.
     try:
-        for item in finished_dir.iterdir():
-            if item.is_file():
-                os.remove(item)
+        with os.scandir(finished_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    os.remove(entry.path)
     except PermissionError:
         logger.error(
             "Permission denied clearing directory: %s", finished_dir,
@@ -491,40 +726,20 @@ def _scan_input_files(data_dir: Path) -> list[Path]:
     Returns:
         Sorted list of file paths to process.
     """
-    xlsx_files = list(data_dir.glob("*.xlsx"))
-    xls_files = list(data_dir.glob("*.xls"))
-
-    # Combine and filter: remove .xlsx from xls glob matches
-    # (*.xls also matches *.xlsx on some platforms)
-    all_files = xlsx_files + [f for f in xls_files if f.suffix.lower() == ".xls"]
-
-    filtered = [
-        f for f in all_files
-        if not f.name.startswith("~$") and not f.name.startswith(".")
-    ]
-
+    # Reason: One scandir pass replaces two glob walks; DirEntry.is_file()
+    # uses the cached directory entry type, and the name filter is a single
+    # case-insensitive regex match (as the Windows glob already was).
+    filtered: list[Path] = []
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if _INPUT_FILE_RE.fullmatch(entry.name) and entry.is_file():
+                filtered.append(Path(entry.path))
+
+    # Reason: scandir order is filesystem-specific; sorting keeps progress
+    # output and the log in the same order on every platform.
     return sorted(filtered, key=lambda p: p.name)
 
 
-def _resolve_diagnostic_file(
-    diagnostic_file: str, data_dir: Path,
-) -> list[Path]:
-    """Resolve the diagnostic file path and return as a single-item list.
-
-    Args:
-        diagnostic_file: Filename or path from --diagnostic argument.
-        data_dir: Path to the data directory for relative resolution.
-
-    Returns:
-        Single-item list containing the resolved file path.
-    """
-    path = Path(diagnostic_file)
-    if not path.is_absolute():
-        path = data_dir / path
-
-    return [path] if path.exists() else []
-
-
 def _build_result(
     filepath: Path,
     status: str,
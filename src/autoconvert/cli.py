@@ -8,11 +8,11 @@ from __future__ import annotations
 
 import argparse
 import logging
+import multiprocessing
 import sys
 from pathlib import Path
 
 from autoconvert import __version__
-from autoconvert.batch import run_batch
 from autoconvert.config import load_config
 from autoconvert.errors import ConfigError
 from autoconvert.logger import setup_diagnostic_logging, setup_logging
@@ -26,13 +26,14 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 
     Accepts optional ``argv`` list for testability (defaults to
     ``sys.argv[1:]`` when None). Supports ``--diagnostic <filename>``
-    for single-file diagnostic mode and ``--version`` for version output.
+    for single-file diagnostic mode, ``--jobs N`` for parallel batch
+    processing, and ``--version`` for version output.
 
     Args:
         argv: Argument list to parse. None uses sys.argv[1:].
 
     Returns:
-        Namespace with ``diagnostic: str | None`` attribute.
+        Namespace with ``diagnostic: str | None`` and ``jobs: int`` attributes.
     """
     parser = argparse.ArgumentParser(
         prog="autoconvert",
@@ -50,9 +51,37 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         metavar="FILENAME",
         help="Process a single file in diagnostic mode with DEBUG-level output",
     )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        metavar="N",
+        help="Number of files to process in parallel (default: 1)",
+    )
     return parser.parse_args(argv)
 
 
+def _positive_int(value: str) -> int:
+    """Parse a strictly positive integer argparse value.
+
+    Args:
+        value: Raw command-line string.
+
+    Returns:
+        The parsed integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not an integer >= 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main() -> None:
     """CLI entry point for AutoConvert.
 
@@ -64,6 +93,10 @@ def main() -> None:
     Returns:
         None. Calls sys.exit() with 0, 1, or 2.
     """
+    # Reason: Required for --jobs worker processes in frozen (PyInstaller)
+    # Windows builds; a no-op everywhere else.
+    multiprocessing.freeze_support()
+
     # Step 1-2: Reconfigure stdout/stderr for UTF-8 with replace fallback.
     # Handles CJK filenames and emoji status indicators on Windows.
     try:
@@ -100,7 +133,7 @@ def main() -> None:
 
     # Step 8: Resolve diagnostic file path if provided.
     data_dir = base_dir / "data"
-    diagnostic_resolved: str | None = None
+    diag_path: Path | None = None
 
     if args.diagnostic:
         diag_path = Path(args.diagnostic)
@@ -109,10 +142,16 @@ def main() -> None:
         if not diag_path.exists():
             logger.error("File not found: %s", diag_path)
             sys.exit(2)
-        diagnostic_resolved = str(diag_path)
 
     # Step 9: Run batch processing.
-    batch_result = run_batch(config, data_dir, diagnostic_file=diagnostic_resolved)
+    # Reason: Imported here so --help and --version return without loading
+    # the batch pipeline and its extraction modules.
+    from autoconvert.batch import run_batch
+
+    batch_result = run_batch(
+        config, data_dir, diagnostic_path=diag_path, jobs=args.jobs,
+        log_path=log_path,
+    )
 
     # Step 10: Print summary.
     print_batch_summary(batch_result)
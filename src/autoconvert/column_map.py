@@ -4,6 +4,10 @@ Detects header rows using a three-tier priority system, maps
 required/optional columns to their positions, and extracts invoice
 numbers from the header area. Implements FR-007, FR-008, FR-009.
 
+Sheets are only read, never modified, and every read is an
+``iter_rows(values_only=True)`` call, so callers may pass the read-only
+SheetSnapshot built by batch.py as well as a writable openpyxl Worksheet.
+
 Error codes owned by this module:
     ERR_014 (HEADER_ROW_NOT_FOUND) — raised by detect_header_row
     ERR_020 (REQUIRED_COLUMN_MISSING) — raised by map_columns
@@ -13,7 +17,8 @@ from __future__ import annotations
 
 import logging
 import re
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
 
 from openpyxl.worksheet.worksheet import Worksheet
 
@@ -40,6 +45,17 @@ _METADATA_MARKERS: tuple[str, ...] = (
 )
 """Metadata marker substrings for Tier-2 demotion (FR-007)."""
 
+# Reason: One alternation per set lets the regex engine scan each cell once
+# instead of a Python-level substring test per keyword. Keywords are all
+# lowercase and matched against the lowercased cell, as before; IGNORECASE
+# is deliberately not used since its Unicode folding differs from lower().
+_HEADER_KEYWORDS_RE: re.Pattern[str] = re.compile(
+    "|".join(re.escape(kw) for kw in sorted(_HEADER_KEYWORDS))
+)
+_METADATA_MARKERS_RE: re.Pattern[str] = re.compile(
+    "|".join(re.escape(marker) for marker in _METADATA_MARKERS)
+)
+
 # Reason: First alternative matches pure numbers/decimals like "123", "45.67".
 # Second alternative matches alphanumeric codes containing at least one digit
 # (e.g., "ABC-123", "PT001") but NOT pure alphabetic words like "Price".
@@ -47,6 +63,22 @@ _NUMERIC_RE: re.Pattern[str] = re.compile(
     r"^[\d]+\.?[\d]*$|^(?=[A-Za-z0-9\-]*\d)[A-Za-z0-9\-]+$"
 )
 
+# Reason: Both _NUMERIC_RE alternatives require a digit, so a single C-level
+# digit search rejects text-only header cells before the anchored match.
+_DIGIT_RE: re.Pattern[str] = re.compile(r"\d")
+
+# Regex for stripping an "INV#" prefix, then a "NO." prefix, from invoice numbers.
+_INV_PREFIX_RE: re.Pattern[str] = re.compile(r"^(?:INV#)?(?:NO\.)?", re.IGNORECASE)
+
+# Leading global inline flags such as "(?i)"; already reflected in .flags.
+_LEADING_FLAGS_RE: re.Pattern[str] = re.compile(r"^\(\?[aiLmsux]+\)")
+# Constructs whose meaning depends on group numbering or names.
+_GROUP_REFERENCE_RE: re.Pattern[str] = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+# Reason: Every scan below is bounded by these constants and passes explicit
+# min/max row and column limits to iter_rows. Never derive a bound from
+# sheet.max_row / max_column or use sheet[...] ranges: stray formatting can
+# inflate a sheet's dimensions to ~1M rows.
 _HEADER_SCAN_ROW_START = 7
 _HEADER_SCAN_ROW_END = 30
 _HEADER_SCAN_COL_COUNT = 13
@@ -70,7 +102,8 @@ def detect_header_row(
     Tier 2 = metadata or data-like rows (lowest priority).
 
     Args:
-        sheet: An openpyxl Worksheet (already unmerged by MergeTracker).
+        sheet: An openpyxl Worksheet or SheetSnapshot (already unmerged by
+            MergeTracker).
         sheet_type: Either "invoice" or "packing".
         config: Application configuration.
 
@@ -88,8 +121,16 @@ def detect_header_row(
     best_tier = 3  # worse than any valid tier
     best_row: int | None = None
 
-    for row in range(_HEADER_SCAN_ROW_START, _HEADER_SCAN_ROW_END + 1):
-        cells = _collect_row_cells(sheet, row, _HEADER_SCAN_COL_COUNT)
+    # Reason: One bounded iter_rows pass reads the whole scan window instead
+    # of 24 x 13 individual sheet.cell() lookups.
+    rows = sheet.iter_rows(
+        min_row=_HEADER_SCAN_ROW_START,
+        max_row=_HEADER_SCAN_ROW_END,
+        max_col=_HEADER_SCAN_COL_COUNT,
+        values_only=True,
+    )
+    for row, values in enumerate(rows, start=_HEADER_SCAN_ROW_START):
+        cells = _row_texts(values)
         filtered = [c for c in cells if not c.startswith("Unnamed:")]
         if len(filtered) < threshold:
             continue
@@ -105,9 +146,15 @@ def detect_header_row(
         else:
             tier = 1
 
-        if tier < best_tier or (tier == best_tier and best_row is None):
+        # Reason: best_tier starts above every real tier, so the first
+        # qualifying row always wins this comparison; ties keep the earlier row.
+        if tier < best_tier:
             best_tier = tier
             best_row = row
+            if tier == 0:
+                # Reason: Nothing outranks tier 0 and ties keep the earlier
+                # row, so the remaining rows cannot change the result.
+                break
 
     if best_row is None:
         raise ProcessingError(
@@ -136,7 +183,7 @@ def map_columns(
     data-row fallback for invoice sheets.
 
     Args:
-        sheet: An openpyxl Worksheet (already unmerged).
+        sheet: An openpyxl Worksheet or SheetSnapshot (already unmerged).
         header_row: 1-based header row number from detect_header_row.
         sheet_type: Either "invoice" or "packing".
         config: Application configuration with compiled field patterns.
@@ -211,7 +258,7 @@ def extract_inv_no_from_header(
     positives via exclude patterns and cleans "INV#"/"NO." prefixes.
 
     Args:
-        sheet: An openpyxl Worksheet for the invoice sheet.
+        sheet: An openpyxl Worksheet or SheetSnapshot for the invoice sheet.
         config: Application configuration with inv_no_cell patterns.
 
     Returns:
@@ -219,41 +266,59 @@ def extract_inv_no_from_header(
         Does NOT raise ERR_021 (that is the batch orchestrator's responsibility).
     """
     inv_cfg = config.inv_no_cell
-
-    # Pass 1: Capture-group patterns.
-    for row in range(1, _INV_NO_SCAN_ROW_END + 1):
-        for col in range(1, _MAP_COL_COUNT + 1):
-            cell_str = _read_cell_str(sheet, row, col)
+    capture_filter = _joined_patterns(tuple(inv_cfg.patterns))
+    label_patterns = _joined_patterns(tuple(inv_cfg.label_patterns))
+    exclude_patterns = _joined_patterns(tuple(inv_cfg.exclude_patterns))
+
+    # Reason: The scan and the adjacent-cell lookups read the same cells;
+    # read them once. The grid extends 2 rows below and 3 columns right of
+    # the scan area so every lookup is plain list indexing.
+    grid = [
+        [_cell_text(raw) for raw in values]
+        for values in sheet.iter_rows(
+            min_row=1,
+            max_row=_INV_NO_SCAN_ROW_END + 2,
+            max_col=_MAP_COL_COUNT + 3,
+            values_only=True,
+        )
+    ]
+
+    # Pass 1: Capture-group patterns. Label cells are recorded in the same
+    # scan, in row-major order, for Pass 2; any capture-group hit still wins
+    # over every label.
+    label_hits: list[tuple[int, int]] = []
+    for row in range(_INV_NO_SCAN_ROW_END):
+        for col in range(_MAP_COL_COUNT):
+            cell_str = grid[row][col]
             if not cell_str:
                 continue
+            if any(p.search(cell_str) for p in label_patterns):
+                label_hits.append((row, col))
+            # Reason: The union only rejects cells no pattern matches; the
+            # patterns themselves still run in config order for group(1).
+            if not any(p.search(cell_str) for p in capture_filter):
+                continue
             for pat in inv_cfg.patterns:
                 m = pat.search(cell_str)
                 if m and m.group(1):
                     candidate = m.group(1).strip()
-                    if _is_excluded(candidate, inv_cfg.exclude_patterns):
+                    if _is_excluded(candidate, exclude_patterns):
                         continue
                     return _clean_inv_no_prefix(candidate)
 
-    # Pass 2: Label patterns with adjacent-cell lookup.
-    for row in range(1, _INV_NO_SCAN_ROW_END + 1):
-        for col in range(1, _MAP_COL_COUNT + 1):
-            cell_str = _read_cell_str(sheet, row, col)
-            if not cell_str:
-                continue
-            if not any(p.search(cell_str) for p in inv_cfg.label_patterns):
-                continue
-
-            # Search adjacent right (up to +3 columns).
-            for offset in range(1, 4):
-                cand = _read_cell_str(sheet, row, col + offset)
-                if cand and not _is_excluded(cand, inv_cfg.exclude_patterns):
-                    return _clean_inv_no_prefix(cand)
+    # Pass 2: Adjacent-cell lookup from each label cell.
+    for row, col in label_hits:
+        # Search adjacent right (up to +3 columns).
+        for offset in range(1, 4):
+            cand = grid[row][col + offset]
+            if cand and not _is_excluded(cand, exclude_patterns):
+                return _clean_inv_no_prefix(cand)
 
-            # Search below: row+1 and row+2.
-            for row_off in (1, 2):
-                cand = _read_cell_str(sheet, row + row_off, col)
-                if cand and not _is_excluded(cand, inv_cfg.exclude_patterns):
-                    return _clean_inv_no_prefix(cand)
+        # Search below: row+1 and row+2.
+        for row_off in (1, 2):
+            cand = grid[row + row_off][col]
+            if cand and not _is_excluded(cand, exclude_patterns):
+                return _clean_inv_no_prefix(cand)
 
     logger.debug("No invoice number found in header area rows 1-15")
     return None
@@ -268,9 +333,22 @@ def _collect_row_cells(
     sheet: Worksheet, row: int, max_cols: int,
 ) -> list[str]:
     """Read non-empty cell string values from a row."""
+    return _row_texts(_read_row(sheet, row, max_cols))
+
+
+def _read_row(sheet: Worksheet, row: int, max_cols: int) -> tuple[object, ...]:
+    """Read columns 1..max_cols of one row as raw values in a single pass."""
+    return next(
+        sheet.iter_rows(
+            min_row=row, max_row=row, max_col=max_cols, values_only=True,
+        )
+    )
+
+
+def _row_texts(values: tuple[object, ...]) -> list[str]:
+    """Return the non-empty stripped string forms of a row's cell values."""
     result: list[str] = []
-    for col in range(1, max_cols + 1):
-        raw = sheet.cell(row=row, column=col).value
+    for raw in values:
         if raw is None:
             continue
         text = str(raw).strip()
@@ -281,17 +359,28 @@ def _collect_row_cells(
 
 def _has_metadata_markers(cells: list[str]) -> bool:
     """Return True if any cell contains a metadata marker substring."""
-    return any(marker in c for c in cells for marker in _METADATA_MARKERS)
+    # Reason: No marker contains NUL, so joining on it cannot create a match
+    # across cell boundaries; one regex call covers the whole row.
+    return _METADATA_MARKERS_RE.search("\0".join(cells)) is not None
 
 
 def _count_numeric_cells(cells: list[str]) -> int:
     """Count cells matching the numeric/alphanumeric-code pattern."""
-    return sum(1 for c in cells if _NUMERIC_RE.match(c))
+    # Reason: All-ASCII-digit cells match the first alternative outright and
+    # skip both regex calls. The negative check stays a \d search, since
+    # str.translate on "0-9" would miss the full-width digits \d accepts.
+    return sum(
+        1 for c in cells
+        if (c.isascii() and c.isdigit())
+        or (_DIGIT_RE.search(c) and _NUMERIC_RE.match(c))
+    )
 
 
 def _has_header_keywords(cells: list[str]) -> bool:
     """Return True if any cell (lowercased) contains a header keyword."""
-    return any(kw in c.lower() for c in cells for kw in _HEADER_KEYWORDS)
+    # Reason: As with metadata markers, a NUL join keeps matches within one
+    # cell and turns the per-cell loop into one lower() and one search.
+    return _HEADER_KEYWORDS_RE.search("\0".join(cells).lower()) is not None
 
 
 def _scan_row_for_fields(
@@ -301,21 +390,64 @@ def _scan_row_for_fields(
     field_map: dict[str, int],
 ) -> None:
     """Scan a row, match cells against field patterns. First match per field wins."""
-    for col in range(1, _MAP_COL_COUNT + 1):
-        raw = sheet.cell(row=row, column=col).value
+    # Reason: Flatten the still-unmapped fields once per row and drop them as
+    # they match, rather than re-walking field_defs and re-checking
+    # field_map for every cell.
+    pending = [
+        (field_name, _joined_patterns(tuple(fp.patterns)))
+        for field_name, fp in field_defs.items()
+        if field_name not in field_map
+    ]
+    for col, raw in enumerate(_read_row(sheet, row, _MAP_COL_COUNT), start=1):
         if raw is None:
             continue
         text = str(raw).strip()
         if not text:
             continue
         normalized = normalize_header(text)
-        for field_name, fp in field_defs.items():
-            if field_name in field_map:
-                continue
-            for pat in fp.patterns:
-                if pat.search(normalized):
-                    field_map[field_name] = col
-                    break
+        matched = False
+        for field_name, patterns in pending:
+            if any(pat.search(normalized) for pat in patterns):
+                field_map[field_name] = col
+                matched = True
+        if matched:
+            pending = [entry for entry in pending if entry[0] not in field_map]
+            if not pending:
+                return
+
+
+@lru_cache(maxsize=64)
+def _joined_patterns(
+    patterns: tuple[re.Pattern[str], ...],
+) -> tuple[re.Pattern[str], ...]:
+    """Join a pattern list into a single alternation when it is safe.
+
+    ``union.search(text)`` finds a match exactly when one of the patterns
+    does, so an any-of test costs one regex call instead of one per
+    pattern. Falls back to the original patterns when they use different
+    flags, VERBOSE mode, or group back-references, or fail to join.
+
+    Args:
+        patterns: Compiled patterns, in config order.
+
+    Returns:
+        A 1-tuple holding the union pattern, or the original patterns.
+    """
+    if len(patterns) < 2:
+        return patterns
+    flags = patterns[0].flags
+    if flags & re.VERBOSE or any(
+        p.flags != flags or _GROUP_REFERENCE_RE.search(p.pattern)
+        for p in patterns
+    ):
+        return patterns
+    body = "|".join(
+        f"(?:{_LEADING_FLAGS_RE.sub('', p.pattern)})" for p in patterns
+    )
+    try:
+        return (re.compile(body, flags),)
+    except re.error:
+        return patterns
 
 
 def _get_missing_required(
@@ -346,12 +478,19 @@ def _currency_data_row_fallback(
         field_map: Mutable field_map to update.
         config: AppConfig with currency field patterns.
     """
-    currency_patterns = config.invoice_columns["currency"].patterns
+    currency_patterns = _joined_patterns(
+        tuple(config.invoice_columns["currency"].patterns)
+    )
 
-    for row in range(header_row + 1, header_row + 5):
+    rows = sheet.iter_rows(
+        min_row=header_row + 1,
+        max_row=header_row + 4,
+        max_col=_MAP_COL_COUNT,
+        values_only=True,
+    )
+    for values in rows:
         found = False
-        for col in range(1, _MAP_COL_COUNT + 1):
-            raw = sheet.cell(row=row, column=col).value
+        for col, raw in enumerate(values, start=1):
             if raw is None:
                 continue
             text = str(raw).strip()
@@ -377,7 +516,7 @@ def _currency_data_row_fallback(
 
 def _is_excluded(
     candidate: str,
-    exclude_patterns: list[re.Pattern[str]],  # type: ignore[type-arg]
+    exclude_patterns: Sequence[re.Pattern[str]],
 ) -> bool:
     """Return True if candidate matches any exclude pattern."""
     return any(p.search(candidate) for p in exclude_patterns)
@@ -385,17 +524,11 @@ def _is_excluded(
 
 def _clean_inv_no_prefix(value: str) -> str:
     """Remove 'INV#' and 'NO.' prefixes from an invoice number."""
-    cleaned = value
-    if cleaned.upper().startswith("INV#"):
-        cleaned = cleaned[4:]
-    if cleaned.upper().startswith("NO."):
-        cleaned = cleaned[3:]
-    return cleaned.strip()
+    return _INV_PREFIX_RE.sub("", value, count=1).strip()
 
 
-def _read_cell_str(sheet: Worksheet, row: int, col: int) -> str | None:
-    """Read a cell as a stripped string, returning None if empty."""
-    raw = sheet.cell(row=row, column=col).value
+def _cell_text(raw: object) -> str | None:
+    """Return a cell value as a stripped string, or None if empty."""
     if raw is None:
         return None
     text = str(raw).strip()
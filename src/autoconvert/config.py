@@ -8,6 +8,7 @@ Error codes owned by this module: ERR_001, ERR_002, ERR_003, ERR_004, ERR_005.
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
 from autoconvert.config_helpers import (
@@ -89,15 +90,19 @@ def load_config(config_dir: Path) -> AppConfig:
     yaml_data = load_yaml(yaml_path)
 
     # Step 3: Compile patterns and build field definitions from YAML data.
+    # Reason: Many pattern strings repeat across sections; compile each once.
+    compile_cache: dict[str, re.Pattern[str]] = {}
     invoice_sheet_patterns = compile_pattern_list(
         yaml_data["invoice_sheet"]["patterns"],
         "invoice_sheet",
         str(yaml_path),
+        compile_cache,
     )
     packing_sheet_patterns = compile_pattern_list(
         yaml_data["packing_sheet"]["patterns"],
         "packing_sheet",
         str(yaml_path),
+        compile_cache,
     )
 
     invoice_columns = build_field_patterns(
@@ -105,16 +110,18 @@ def load_config(config_dir: Path) -> AppConfig:
         _INVOICE_FIELD_NAMES,
         "invoice_columns",
         str(yaml_path),
+        compile_cache,
     )
     packing_columns = build_field_patterns(
         yaml_data["packing_columns"],
         _PACKING_FIELD_NAMES,
         "packing_columns",
         str(yaml_path),
+        compile_cache,
     )
 
     inv_no_cell = build_inv_no_cell_config(
-        yaml_data["inv_no_cell"], str(yaml_path)
+        yaml_data["inv_no_cell"], str(yaml_path), compile_cache
     )
 
     # Step 4: Load currency rules.
@@ -6,6 +6,9 @@ These functions are not part of the public API.
 
 from __future__ import annotations
 
+import json
+import operator
+import os
 import re
 from pathlib import Path
 from typing import Any, cast
@@ -15,10 +18,18 @@ import yaml
 
 from autoconvert.errors import ConfigError, ErrorCode
 from autoconvert.models import FieldPattern, InvNoCellConfig
+from autoconvert.utils import TEMPLATE_SHEET_NAME
 
 # Valid field type strings for column definitions.
 _VALID_FIELD_TYPES: frozenset[str] = frozenset({"string", "numeric", "currency"})
 
+# Reason: The libyaml-backed loader parses the same safe subset in C; fall
+# back to the pure-Python loader when PyYAML was built without libyaml.
+_YAML_LOADER: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Keys every column field entry must define, fetched in one call.
+_FIELD_ENTRY_KEYS = operator.itemgetter("patterns", "type", "required")
+
 # Required top-level keys in field_patterns.yaml.
 _REQUIRED_YAML_KEYS: frozenset[str] = frozenset(
     {
@@ -34,6 +45,10 @@ _REQUIRED_YAML_KEYS: frozenset[str] = frozenset(
 def load_yaml(yaml_path: Path) -> dict[str, Any]:
     """Load and structurally validate field_patterns.yaml.
 
+    The parsed document is cached in a JSON sidecar
+    (``field_patterns.yaml.cache.json``) keyed by the YAML file's mtime and
+    size, so unchanged config is not re-parsed on every run.
+
     Args:
         yaml_path: Path to field_patterns.yaml.
 
@@ -43,22 +58,94 @@ def load_yaml(yaml_path: Path) -> dict[str, Any]:
     Raises:
         ConfigError: On missing required top-level keys (ERR_004).
     """
-    with open(yaml_path, encoding="utf-8") as f:
-        config_data: dict[str, Any] = cast(dict[str, Any], yaml.safe_load(f))
-
-    for key in _REQUIRED_YAML_KEYS:
-        if key not in config_data:
-            raise ConfigError(
-                code=ErrorCode.ERR_004,
-                message=f"Missing required key '{key}' in {yaml_path.name}",
-                path=str(yaml_path),
-            )
+    config_data = _read_yaml_cache(yaml_path)
+    if config_data is None:
+        source = _yaml_cache_key(yaml_path)
+        with open(yaml_path, encoding="utf-8") as f:
+            config_data = cast(dict[str, Any], yaml.load(f, Loader=_YAML_LOADER))
+        _write_yaml_cache(yaml_path, source, config_data)
+
+    missing = sorted(_REQUIRED_YAML_KEYS.difference(config_data))
+    if missing:
+        noun = "key" if len(missing) == 1 else "keys"
+        names = ", ".join(f"'{key}'" for key in missing)
+        raise ConfigError(
+            code=ErrorCode.ERR_004,
+            message=f"Missing required {noun} {names} in {yaml_path.name}",
+            path=str(yaml_path),
+        )
 
     return config_data
 
 
+def _yaml_cache_key(yaml_path: Path) -> list[int]:
+    """Return the [mtime_ns, size] pair identifying a YAML file version."""
+    st = yaml_path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _yaml_cache_path(yaml_path: Path) -> Path:
+    """Return the JSON sidecar path for a YAML file."""
+    return yaml_path.with_name(yaml_path.name + ".cache.json")
+
+
+def _read_yaml_cache(yaml_path: Path) -> dict[str, Any] | None:
+    """Return the parsed YAML from its JSON sidecar, if the sidecar is current.
+
+    Args:
+        yaml_path: Path to the YAML source file.
+
+    Returns:
+        The cached dict, or None when the sidecar is missing, unreadable,
+        or was written for a different version of the YAML file.
+    """
+    try:
+        with open(_yaml_cache_path(yaml_path), encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["source"] != _yaml_cache_key(yaml_path):
+            return None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    data = cached.get("data")
+    return data if isinstance(data, dict) else None
+
+
+def _write_yaml_cache(yaml_path: Path, source: list[int], data: Any) -> None:
+    """Best-effort write of parsed YAML to its JSON sidecar.
+
+    Skipped when the data does not survive a JSON round trip unchanged
+    (e.g. non-string keys or dates). Write failures such as a read-only
+    config directory are ignored; the YAML is simply parsed next time.
+
+    Args:
+        yaml_path: Path to the YAML source file.
+        source: The YAML's cache key, taken before it was parsed.
+        data: The parsed YAML document.
+    """
+    # Reason: The key is taken before parsing, so an edit made while the
+    # file was being read leaves a stale key and forces a re-parse.
+    if not isinstance(data, dict):
+        return
+    try:
+        payload = json.dumps(
+            {"source": source, "data": data},
+            ensure_ascii=False,
+        )
+        if json.loads(payload)["data"] != data:
+            return
+        cache_path = _yaml_cache_path(yaml_path)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(payload, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        return
+
+
 def compile_pattern(
-    pattern_str: str, context_name: str, file_path: str
+    pattern_str: str,
+    context_name: str,
+    file_path: str,
+    compile_cache: dict[str, re.Pattern[str]] | None = None,
 ) -> re.Pattern[str]:
     """Compile a single regex pattern with IGNORECASE flag.
 
@@ -66,6 +153,8 @@ def compile_pattern(
         pattern_str: The regex pattern string to compile.
         context_name: Descriptive name for error messages (e.g. field name).
         file_path: Config file path for error messages.
+        compile_cache: Optional per-load memo of already compiled pattern
+            strings; identical strings then share one Pattern object.
 
     Returns:
         Compiled re.Pattern.
@@ -73,8 +162,12 @@ def compile_pattern(
     Raises:
         ConfigError: On invalid regex (ERR_002).
     """
+    if compile_cache is not None:
+        cached = compile_cache.get(pattern_str)
+        if cached is not None:
+            return cached
     try:
-        return re.compile(pattern_str, re.IGNORECASE)
+        compiled = re.compile(pattern_str, re.IGNORECASE)
     except re.error as exc:
         raise ConfigError(
             code=ErrorCode.ERR_002,
@@ -84,10 +177,16 @@ def compile_pattern(
             ),
             path=file_path,
         ) from exc
+    if compile_cache is not None:
+        compile_cache[pattern_str] = compiled
+    return compiled
 
 
 def compile_pattern_list(
-    patterns: list[str], context_name: str, file_path: str
+    patterns: list[str],
+    context_name: str,
+    file_path: str,
+    compile_cache: dict[str, re.Pattern[str]] | None = None,
 ) -> list[re.Pattern[str]]:
     """Compile a list of regex pattern strings.
 
@@ -95,6 +194,7 @@ def compile_pattern_list(
         patterns: List of regex strings to compile.
         context_name: Descriptive name for error messages.
         file_path: Config file path for error messages.
+        compile_cache: Optional per-load memo passed to compile_pattern.
 
     Returns:
         List of compiled re.Pattern objects.
@@ -102,7 +202,10 @@ def compile_pattern_list(
     Raises:
         ConfigError: On any invalid regex (ERR_002).
     """
-    return [compile_pattern(p, context_name, file_path) for p in patterns]
+    return [
+        compile_pattern(p, context_name, file_path, compile_cache)
+        for p in patterns
+    ]
 
 
 def build_field_patterns(
@@ -110,6 +213,7 @@ def build_field_patterns(
     expected_fields: frozenset[str],
     section_name: str,
     file_path: str,
+    compile_cache: dict[str, re.Pattern[str]] | None = None,
 ) -> dict[str, FieldPattern]:
     """Build FieldPattern objects from a YAML column section.
 
@@ -121,6 +225,7 @@ def build_field_patterns(
         expected_fields: Set of required field names.
         section_name: Section name for error messages.
         file_path: Config file path for error messages.
+        compile_cache: Optional per-load memo of compiled pattern strings.
 
     Returns:
         Dict mapping field name to FieldPattern.
@@ -131,17 +236,19 @@ def build_field_patterns(
     """
     result: dict[str, FieldPattern] = {}
 
-    # Check all expected fields are present.
-    for field_name in expected_fields:
-        if field_name not in section:
-            raise ConfigError(
-                code=ErrorCode.ERR_004,
-                message=(
-                    f"Missing field '{field_name}' in "
-                    f"'{section_name}' in {Path(file_path).name}"
-                ),
-                path=file_path,
-            )
+    # Check all expected fields are present, reporting every missing one.
+    missing = sorted(expected_fields.difference(section))
+    if missing:
+        noun = "field" if len(missing) == 1 else "fields"
+        names = ", ".join(f"'{name}'" for name in missing)
+        raise ConfigError(
+            code=ErrorCode.ERR_004,
+            message=(
+                f"Missing {noun} {names} in "
+                f"'{section_name}' in {Path(file_path).name}"
+            ),
+            path=file_path,
+        )
 
     for field_name in expected_fields:
         entry = section[field_name]
@@ -152,6 +259,7 @@ def build_field_patterns(
             entry["patterns"],
             f"{section_name}.{field_name}",
             file_path,
+            compile_cache,
         )
 
         result[field_name] = FieldPattern(
@@ -190,19 +298,22 @@ def _validate_field_entry(
             path=file_path,
         )
 
-    for required_key in ("patterns", "type", "required"):
-        if required_key not in entry:
-            raise ConfigError(
-                code=ErrorCode.ERR_004,
-                message=(
-                    f"Missing key '{required_key}' in "
-                    f"'{section_name}.{field_name}' in "
-                    f"{Path(file_path).name}"
-                ),
-                path=file_path,
-            )
+    try:
+        patterns, field_type, required = _FIELD_ENTRY_KEYS(entry)
+    except KeyError as exc:
+        # Reason: itemgetter fetches keys in order, so the first missing
+        # key is reported, as the former per-key loop did.
+        raise ConfigError(
+            code=ErrorCode.ERR_004,
+            message=(
+                f"Missing key '{exc.args[0]}' in "
+                f"'{section_name}.{field_name}' in "
+                f"{Path(file_path).name}"
+            ),
+            path=file_path,
+        ) from None
 
-    if not isinstance(entry["patterns"], list):
+    if not isinstance(patterns, list):
         raise ConfigError(
             code=ErrorCode.ERR_004,
             message=(
@@ -211,7 +322,6 @@ def _validate_field_entry(
             path=file_path,
         )
 
-    field_type = entry["type"]
     if field_type not in _VALID_FIELD_TYPES:
         raise ConfigError(
             code=ErrorCode.ERR_004,
@@ -223,7 +333,7 @@ def _validate_field_entry(
             path=file_path,
         )
 
-    if not isinstance(entry["required"], bool):
+    if not isinstance(required, bool):
         raise ConfigError(
             code=ErrorCode.ERR_004,
             message=(
@@ -234,13 +344,16 @@ def _validate_field_entry(
 
 
 def build_inv_no_cell_config(
-    section: dict[str, Any], file_path: str
+    section: dict[str, Any],
+    file_path: str,
+    compile_cache: dict[str, re.Pattern[str]] | None = None,
 ) -> InvNoCellConfig:
     """Build InvNoCellConfig from the inv_no_cell YAML section.
 
     Args:
         section: The parsed YAML dict for inv_no_cell.
         file_path: Config file path for error messages.
+        compile_cache: Optional per-load memo of compiled pattern strings.
 
     Returns:
         InvNoCellConfig with all patterns compiled.
@@ -261,17 +374,19 @@ def build_inv_no_cell_config(
 
     return InvNoCellConfig(
         patterns=compile_pattern_list(
-            section["patterns"], "inv_no_cell.patterns", file_path
+            section["patterns"], "inv_no_cell.patterns", file_path, compile_cache
         ),
         label_patterns=compile_pattern_list(
             section["label_patterns"],
             "inv_no_cell.label_patterns",
             file_path,
+            compile_cache,
         ),
         exclude_patterns=compile_pattern_list(
             section["exclude_patterns"],
             "inv_no_cell.exclude_patterns",
             file_path,
+            compile_cache,
         ),
     )
 
@@ -314,22 +429,28 @@ def load_lookup_table(
     Raises:
         ConfigError: On duplicate keys (ERR_003) or structural issues (ERR_005).
     """
-    wb = openpyxl.load_workbook(xlsx_path, data_only=True)
+    # Reason: The table is only streamed row by row, so read_only mode
+    # avoids building the full cell/style model of the workbook.
+    wb = openpyxl.load_workbook(xlsx_path, data_only=True, read_only=True)
     try:
-        ws = wb[sheet_name]
-    except KeyError:
-        wb.close()
-        raise ConfigError(
-            code=ErrorCode.ERR_005,
-            message=f"Sheet '{sheet_name}' not found in {display_filename}",
-            path=str(xlsx_path),
+        try:
+            ws = wb[sheet_name]
+        except KeyError:
+            raise ConfigError(
+                code=ErrorCode.ERR_005,
+                message=f"Sheet '{sheet_name}' not found in {display_filename}",
+                path=str(xlsx_path),
+            ) from None
+
+        # Reason: read_only sheets are sized from the file's <dimension> tag,
+        # which some writers leave stale; a wrong tag would truncate rows.
+        ws.reset_dimensions()
+        source_col, target_col = _find_lookup_columns(ws, display_filename, xlsx_path)
+        return _read_lookup_rows(
+            ws, source_col, target_col, display_filename, xlsx_path,
         )
-
-    source_col, target_col = _find_lookup_columns(ws, display_filename, xlsx_path)
-    lookup = _read_lookup_rows(ws, source_col, target_col, display_filename, xlsx_path)
-
-    wb.close()
-    return lookup
+    finally:
+        wb.close()
 
 
 def _find_lookup_columns(
@@ -351,8 +472,8 @@ def _find_lookup_columns(
     source_col: int | None = None
     target_col: int | None = None
 
-    for col_idx in range(1, ws.max_column + 1):
-        header_val = ws.cell(row=1, column=col_idx).value
+    header_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+    for col_idx, header_val in enumerate(header_row, start=1):
         if isinstance(header_val, str):
             header_val = header_val.strip()
             if header_val == "Source_Value":
@@ -397,9 +518,11 @@ def _read_lookup_rows(
     """
     lookup: dict[str, str] = {}
 
-    for row_idx in range(2, ws.max_row + 1):
-        source_raw = ws.cell(row=row_idx, column=source_col).value
-        target_raw = ws.cell(row=row_idx, column=target_col).value
+    # Reason: Stream value tuples instead of building a Cell per lookup.
+    # Rows can be shorter than the header when trailing cells are absent.
+    for row in ws.iter_rows(min_row=2, values_only=True):
+        source_raw = row[source_col - 1] if source_col <= len(row) else None
+        target_raw: Any = row[target_col - 1] if target_col <= len(row) else None
 
         # Skip rows where source is empty.
         if source_raw is None or (
@@ -412,12 +535,24 @@ def _read_lookup_rows(
         # Normalize Target_Code to str.
         # Reason: openpyxl may read integer cell values as int; the PRD
         # requires all Target_Code values to be stored as str.
-        if isinstance(target_raw, (int, float)):
+        # Exact-type checks cover the common cell types without an MRO walk;
+        # the isinstance branch keeps bool and other subclasses as before.
+        target_type = type(target_raw)
+        if target_type is int or target_type is float:
+            target_value = str(int(target_raw))
+        elif target_type is str:
+            target_value = target_raw.strip()
+        elif isinstance(target_raw, (int, float)):
             target_value = str(int(target_raw))
         else:
             target_value = str(target_raw).strip() if target_raw else ""
 
-        if key in lookup:
+        # Reason: One hash probe per row; the dict only stays the same size
+        # when the key was already present. Comparing the returned value by
+        # identity would miss duplicates whose targets are interned strings.
+        size = len(lookup)
+        lookup.setdefault(key, target_value)
+        if len(lookup) == size:
             raise ConfigError(
                 code=ErrorCode.ERR_003,
                 message=(
@@ -426,8 +561,6 @@ def _read_lookup_rows(
                 path=str(xlsx_path),
             )
 
-        lookup[key] = target_value
-
     return lookup
 
 
@@ -444,42 +577,58 @@ def validate_template(template_path: Path) -> None:
         ConfigError: On missing sheet, too few columns, or too few rows
             (ERR_005).
     """
-    wb = openpyxl.load_workbook(template_path, data_only=True)
-
-    sheet_name = "\u5de5\u4f5c\u88681"  # 工作表1
-    if sheet_name not in wb.sheetnames:
+    wb = openpyxl.load_workbook(template_path, data_only=True, read_only=True)
+    try:
+        _validate_template_sheet(wb, template_path)
+    finally:
         wb.close()
+
+
+def _validate_template_sheet(wb: Any, template_path: Path) -> None:
+    """Check the template workbook's sheet name and dimensions.
+
+    Args:
+        wb: The template workbook, opened read_only.
+        template_path: Path for error messages.
+
+    Raises:
+        ConfigError: On missing sheet, too few columns, or too few rows
+            (ERR_005).
+    """
+    if TEMPLATE_SHEET_NAME not in wb.sheetnames:
         raise ConfigError(
             code=ErrorCode.ERR_005,
             message=(
-                f"Sheet '{sheet_name}' not found in "
+                f"Sheet '{TEMPLATE_SHEET_NAME}' not found in "
                 f"{template_path.name}"
             ),
             path=str(template_path),
         )
 
-    ws = wb[sheet_name]
+    ws = wb[TEMPLATE_SHEET_NAME]
+    # Reason: read_only sheets take their size from the <dimension> tag,
+    # which may be missing or stale; measure the rows actually stored.
+    ws.reset_dimensions()
+    max_row = max_column = 0
+    for max_row, values in enumerate(ws.iter_rows(values_only=True), start=1):
+        max_column = max(max_column, len(values))
 
-    if ws.max_column < 40:
-        wb.close()
+    if max_column < 40:
         raise ConfigError(
             code=ErrorCode.ERR_005,
             message=(
-                f"Template sheet '{sheet_name}' has {ws.max_column} columns, "
+                f"Template sheet '{TEMPLATE_SHEET_NAME}' has {max_column} columns, "
                 f"expected at least 40 (A-AN)"
             ),
             path=str(template_path),
         )
 
-    if ws.max_row < 4:
-        wb.close()
+    if max_row < 4:
         raise ConfigError(
             code=ErrorCode.ERR_005,
             message=(
-                f"Template sheet '{sheet_name}' has {ws.max_row} rows, "
+                f"Template sheet '{TEMPLATE_SHEET_NAME}' has {max_row} rows, "
                 f"expected at least 4 header metadata rows"
             ),
             path=str(template_path),
         )
-
-    wb.close()
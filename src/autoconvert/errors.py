@@ -6,13 +6,14 @@ ProcessingError, and ConfigError exception classes.
 
 from __future__ import annotations
 
-from enum import Enum
+from enum import StrEnum
 
 
-class ErrorCode(str, Enum):
+class ErrorCode(StrEnum):
     """Error codes for file processing failures.
 
-    Each member's string value equals its name (e.g., ErrorCode.ERR_001 == "ERR_001").
+    Each member's string value equals its name (e.g., ErrorCode.ERR_001 == "ERR_001"),
+    and str()/%s formatting yield that bare value, as the log format expects.
     Codes are grouped by processing phase:
         ERR_001-005: Config errors (fatal startup)
         ERR_010-013: File/sheet access errors
@@ -63,10 +64,11 @@ class ErrorCode(str, Enum):
     ERR_052 = "ERR_052"
 
 
-class WarningCode(str, Enum):
+class WarningCode(StrEnum):
     """Warning codes for non-fatal processing issues (Attention status).
 
-    Each member's string value equals its name (e.g., WarningCode.ATT_002 == "ATT_002").
+    Each member's string value equals its name (e.g., WarningCode.ATT_002 == "ATT_002"),
+    and str()/%s formatting yield that bare value.
     Note: ATT_001 does not exist in the PRD catalog.
     """
 
@@ -89,6 +91,10 @@ class ProcessingError(Exception):
         field: Field name involved (e.g., "qty", "part_no").
     """
 
+    # Reason: Slots keep the fields off the lazily created instance __dict__,
+    # so raising does not allocate one.
+    __slots__ = ("code", "message", "filename", "row", "field")
+
     def __init__(
         self,
         code: str,
@@ -113,6 +119,19 @@ class ProcessingError(Exception):
         self.row = row
         self.field = field
 
+    def __reduce__(
+        self,
+    ) -> tuple[type[ProcessingError], tuple[str, str, str | None, int | None, str | None]]:
+        """Pickle with all five fields so results survive a process pool.
+
+        Returns:
+            Constructor and positional arguments for unpickling.
+        """
+        return (
+            self.__class__,
+            (self.code, self.message, self.filename, self.row, self.field),
+        )
+
 
 class ConfigError(Exception):
     """Exception raised for fatal configuration errors during startup.
@@ -125,6 +144,8 @@ class ConfigError(Exception):
         path: Path to the config file that caused the error.
     """
 
+    __slots__ = ("code", "message", "path")
+
     def __init__(
         self,
         code: str,
@@ -142,3 +163,13 @@ class ConfigError(Exception):
         self.code = code
         self.message = message
         self.path = path
+
+    def __reduce__(
+        self,
+    ) -> tuple[type[ConfigError], tuple[str, str, str | None]]:
+        """Pickle with all three fields; slot values are not in __dict__.
+
+        Returns:
+            Constructor and positional arguments for unpickling.
+        """
+        return (self.__class__, (self.code, self.message, self.path))
@@ -9,6 +9,7 @@ from __future__ import annotations
 import logging
 import re
 from decimal import Decimal
+from typing import Any
 
 from openpyxl.worksheet.worksheet import Worksheet
 
@@ -18,8 +19,8 @@ from autoconvert.models import ColumnMapping, InvoiceItem
 from autoconvert.utils import (
     FOOTER_KEYWORDS,
     detect_cell_precision,
+    has_stop_keyword,
     is_placeholder,
-    is_stop_keyword,
     parse_numeric,
     round_half_up,
     strip_unit_suffix,
@@ -32,6 +33,18 @@ _INV_PREFIX_RE: re.Pattern[str] = re.compile(
     r"^(?:INV\s*#\s*|NO\.\s*)", re.IGNORECASE
 )
 
+# Stop keywords are searched in columns A-J (FR-011 stop condition 1).
+_STOP_SCAN_COLS = 10
+
+# Part_no stop conditions 2 and 3: "total" (any case) or a Chinese footer
+# keyword, as one alternation so each row is scanned once.
+_PART_NO_STOP_RE: re.Pattern[str] = re.compile(
+    "|".join(["(?i:total)", *map(re.escape, FOOTER_KEYWORDS)])
+)
+
+# Header continuation rows repeat the "part no" label inside the data area.
+_PART_NO_HEADER_RE: re.Pattern[str] = re.compile("part no", re.IGNORECASE)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -39,12 +52,14 @@ _INV_PREFIX_RE: re.Pattern[str] = re.compile(
 
 
 def _read_string_field(
-    sheet: Worksheet, row: int, col: int, merge_tracker: MergeTracker,
+    sheet: Worksheet, values: tuple[Any, ...], row: int, col: int,
+    merge_tracker: MergeTracker,
 ) -> str | None:
-    """Read a string field from the sheet with merge propagation.
+    """Read a string field from the row with merge propagation.
 
     Args:
-        sheet: The worksheet to read from.
+        sheet: The worksheet, for anchor values of merges from other rows.
+        values: The row's values from iter_rows, column 1 first.
         row: 1-based row index.
         col: 1-based column index.
         merge_tracker: MergeTracker for merge-aware reading.
@@ -52,11 +67,15 @@ def _read_string_field(
     Returns:
         Stripped string value, or None if empty.
     """
-    if merge_tracker.is_in_merge(row, col) and not merge_tracker.is_merge_anchor(row, col):
+    if merge_tracker.is_merge_continuation(row, col):
         raw = merge_tracker.get_anchor_value(sheet, row, col)
     else:
-        raw = sheet.cell(row=row, column=col).value
+        raw = values[col - 1]
 
+    # Reason: Text is the common case; an exact-type check returns it before
+    # the isinstance chain, which still handles numbers, bool and subclasses.
+    if type(raw) is str:
+        return raw.strip() or None
     if raw is None:
         return None
     if isinstance(raw, (int, float)) and not isinstance(raw, bool):
@@ -69,13 +88,14 @@ def _read_string_field(
 
 
 def _require_string(
-    sheet: Worksheet, row: int, col: int,
+    sheet: Worksheet, values: tuple[Any, ...], row: int, col: int,
     field_name: str, merge_tracker: MergeTracker,
 ) -> str:
     """Read a required string field; raise ERR_030 if empty or placeholder.
 
     Args:
-        sheet: The worksheet to read from.
+        sheet: The worksheet, for anchor values of merges from other rows.
+        values: The row's values from iter_rows, column 1 first.
         row: 1-based row index.
         col: 1-based column index.
         field_name: Field name for error context.
@@ -87,7 +107,25 @@ def _require_string(
     Raises:
         ProcessingError: ERR_030 if the field is empty or a placeholder.
     """
-    val = _read_string_field(sheet, row, col, merge_tracker)
+    return _check_required(
+        _read_string_field(sheet, values, row, col, merge_tracker), row, field_name,
+    )
+
+
+def _check_required(val: str | None, row: int, field_name: str) -> str:
+    """Validate an already-read required string field.
+
+    Args:
+        val: Stripped value from _read_string_field, or None if empty.
+        row: 1-based row index.
+        field_name: Field name for error context.
+
+    Returns:
+        The value, when it is neither empty nor a placeholder.
+
+    Raises:
+        ProcessingError: ERR_030 if the field is empty or a placeholder.
+    """
     if val is None:
         raise ProcessingError(
             code=ErrorCode.ERR_030,
@@ -104,7 +142,7 @@ def _require_string(
 
 
 def _read_brand_type(
-    sheet: Worksheet, row: int, brand_type_col: int,
+    sheet: Worksheet, values: tuple[Any, ...], row: int, brand_type_col: int,
     merge_tracker: MergeTracker, brand_value: str,
 ) -> str:
     """Read brand_type with horizontal merge handling.
@@ -113,7 +151,8 @@ def _read_brand_type(
     column is None after unmerging. Both get the anchor value.
 
     Args:
-        sheet: The worksheet to read from.
+        sheet: The worksheet, for anchor values of merges from other rows.
+        values: The row's values from iter_rows, column 1 first.
         row: 1-based row index.
         brand_type_col: 1-based column index for brand_type.
         merge_tracker: MergeTracker instance.
@@ -125,15 +164,14 @@ def _read_brand_type(
     Raises:
         ProcessingError: ERR_030 if brand_type is empty after resolution.
     """
-    if merge_tracker.is_in_merge(row, brand_type_col):
-        if not merge_tracker.is_merge_anchor(row, brand_type_col):
-            # Reason: Non-anchor of horizontal merge — propagate anchor value.
-            anchor_val = merge_tracker.get_anchor_value(sheet, row, brand_type_col)
-            if anchor_val is not None and isinstance(anchor_val, str) and anchor_val.strip():
-                return anchor_val.strip()
-            return brand_value
-
-    raw = sheet.cell(row=row, column=brand_type_col).value
+    if merge_tracker.is_merge_continuation(row, brand_type_col):
+        # Reason: Non-anchor of horizontal merge — propagate anchor value.
+        anchor_val = merge_tracker.get_anchor_value(sheet, row, brand_type_col)
+        if anchor_val is not None and isinstance(anchor_val, str) and anchor_val.strip():
+            return anchor_val.strip()
+        return brand_value
+
+    raw = values[brand_type_col - 1]
     if raw is None or (isinstance(raw, str) and raw.strip() == ""):
         raise ProcessingError(
             code=ErrorCode.ERR_030,
@@ -153,13 +191,15 @@ def _read_brand_type(
 
 
 def _read_numeric_field(
-    sheet: Worksheet, row: int, col: int,
+    sheet: Worksheet, values: tuple[Any, ...], row: int, col: int,
     field_name: str, precision: int | None, merge_tracker: MergeTracker,
 ) -> Decimal:
-    """Read and round a numeric field from the sheet.
+    """Read and round a numeric field from the row.
 
     Args:
-        sheet: The worksheet to read from.
+        sheet: The worksheet, for the cell's number format when detecting
+            precision.
+        values: The row's values from iter_rows, column 1 first.
         row: 1-based row index.
         col: 1-based column index.
         field_name: Field name for error context.
@@ -172,11 +212,10 @@ def _read_numeric_field(
     Raises:
         ProcessingError: ERR_030 for empty fields, ERR_031 for invalid values.
     """
-    cell = sheet.cell(row=row, column=col)
-    raw = cell.value
+    raw = values[col - 1]
 
     # Non-anchor merged numeric cell: empty after unmerge.
-    if merge_tracker.is_in_merge(row, col) and not merge_tracker.is_merge_anchor(row, col):
+    if merge_tracker.is_merge_continuation(row, col):
         raise ProcessingError(
             code=ErrorCode.ERR_030,
             message=f"Empty required field '{field_name}' at row {row} (non-anchor of merged cell)",
@@ -196,7 +235,9 @@ def _read_numeric_field(
     value = parse_numeric(raw, field_name, row)
 
     if precision is None:
-        detected = detect_cell_precision(cell.value, cell.number_format)
+        # Reason: Only precision detection needs the cell object itself.
+        number_format = sheet.cell(row=row, column=col).number_format
+        detected = detect_cell_precision(values[col - 1], number_format)
         return round_half_up(value, detected)
     return round_half_up(value, precision)
 
@@ -210,24 +251,24 @@ def _clean_inv_no(value: str) -> str:
     Returns:
         Cleaned invoice number without prefixes.
     """
-    return _INV_PREFIX_RE.sub("", value).strip()
+    # Reason: The pattern is anchored, so match + slice does the same job
+    # as sub() without building a replacement result.
+    match = _INV_PREFIX_RE.match(value)
+    if match is not None:
+        value = value[match.end():]
+    return value.strip()
 
 
-def _scan_stop_keywords(sheet: Worksheet, row: int) -> bool:
+def _scan_stop_keywords(values: tuple[Any, ...]) -> bool:
     """Scan columns A-J (1-10) for stop keywords.
 
     Args:
-        sheet: The worksheet to scan.
-        row: 1-based row index.
+        values: The row's values from iter_rows, column 1 first.
 
     Returns:
         True if any string cell in columns A-J contains a stop keyword.
     """
-    for col in range(1, 11):
-        raw = sheet.cell(row=row, column=col).value
-        if raw is not None and isinstance(raw, str) and is_stop_keyword(raw):
-            return True
-    return False
+    return has_stop_keyword(values[:_STOP_SCAN_COLS])
 
 
 def _check_part_no_stops(part_no: str | None) -> bool:
@@ -239,21 +280,18 @@ def _check_part_no_stops(part_no: str | None) -> bool:
     Returns:
         True if a stop condition is triggered.
     """
-    if part_no is None:
-        return False
-    lowered = part_no.lower()
-    if "total" in lowered:
-        return True
-    return any(kw in part_no for kw in FOOTER_KEYWORDS)
+    return part_no is not None and _PART_NO_STOP_RE.search(part_no) is not None
 
 
 def _read_optional_string(
-    sheet: Worksheet, row: int, col: int | None, merge_tracker: MergeTracker,
+    sheet: Worksheet, values: tuple[Any, ...], row: int, col: int | None,
+    merge_tracker: MergeTracker,
 ) -> str | None:
     """Read an optional string field; return None if empty/placeholder.
 
     Args:
-        sheet: The worksheet to read from.
+        sheet: The worksheet, for anchor values of merges from other rows.
+        values: The row's values from iter_rows, column 1 first.
         row: 1-based row index.
         col: 1-based column index, or None if column absent.
         merge_tracker: MergeTracker instance.
@@ -263,7 +301,7 @@ def _read_optional_string(
     """
     if col is None:
         return None
-    val = _read_string_field(sheet, row, col, merge_tracker)
+    val = _read_string_field(sheet, values, row, col, merge_tracker)
     if val is not None and not is_placeholder(val):
         return val
     return None
@@ -324,14 +362,23 @@ def extract_invoice_items(
     c_cod = fm.get("cod")
     c_inv = fm.get("inv_no")
     c_serial = fm.get("serial")
+    # Rows without their own inv_no share the batch value; clean it once.
+    batch_inv_no = _clean_inv_no(inv_no) if inv_no is not None else None
+
+    # Reason: One bounded iter_rows pass yields each row's values as a tuple,
+    # wide enough for the A-J stop scan and every mapped column.
+    max_col = max(_STOP_SCAN_COLS, *fm.values())
+    rows = sheet.iter_rows(
+        min_row=start_row, max_row=max_row, max_col=max_col, values_only=True,
+    )
 
-    for row in range(start_row, max_row + 1):
+    for row, values in enumerate(rows, start=start_row):
         # Step a: Read raw part_no and qty for stop/blank checks.
-        part_no_raw = _read_string_field(sheet, row, c_part, merge_tracker)
-        qty_raw = sheet.cell(row=row, column=c_qty).value
+        part_no_raw = _read_string_field(sheet, values, row, c_part, merge_tracker)
+        qty_raw = values[c_qty - 1]
 
         # Step b: ALWAYS scan A-J for stop keywords first.
-        if _scan_stop_keywords(sheet, row):
+        if _scan_stop_keywords(values):
             logger.debug("Stop keyword in columns A-J at row %d", row)
             break
 
@@ -350,49 +397,48 @@ def extract_invoice_items(
             continue  # Leading blank row: skip silently.
 
         # Step e: Header continuation filter.
-        if part_no_raw is not None and "part no" in part_no_raw.lower():
+        if part_no_raw is not None and _PART_NO_HEADER_RE.search(part_no_raw):
             logger.debug("Skipping header continuation row %d", row)
             continue
 
-        # Step f: Read all field values.
-        part_no = _require_string(sheet, row, c_part, "part_no", merge_tracker)
-        po_no = _require_string(sheet, row, c_po, "po_no", merge_tracker)
-        currency = _require_string(sheet, row, c_curr, "currency", merge_tracker)
-        # Reason: COO is read as optional first because COD can override it
-        # (FR-011). If COO is empty but COD has a meaningful value, COD is
-        # used. ERR_030 fires only if BOTH are empty/placeholder.
-        coo_raw = _read_optional_string(sheet, row, c_coo, merge_tracker)
-        cod_value = _read_optional_string(sheet, row, c_cod, merge_tracker)
-        if cod_value is not None and not is_placeholder(cod_value):
-            coo = cod_value
-        elif coo_raw is not None and not is_placeholder(coo_raw):
-            coo = coo_raw
-        else:
+        # Step f: Read all field values. part_no was already read in step a.
+        part_no = _check_required(part_no_raw, row, "part_no")
+        po_no = _require_string(sheet, values, row, c_po, "po_no", merge_tracker)
+        currency = _require_string(sheet, values, row, c_curr, "currency", merge_tracker)
+        # Reason: COD overrides COO (FR-011), so COD is read first and COO
+        # only when COD is empty. _read_optional_string already maps
+        # placeholders to None. ERR_030 fires only if BOTH are empty.
+        cod_value = _read_optional_string(sheet, values, row, c_cod, merge_tracker)
+        coo: str | None = cod_value
+        if coo is None:
+            coo = _read_optional_string(sheet, values, row, c_coo, merge_tracker)
+        if coo is None:
             raise ProcessingError(
                 code=ErrorCode.ERR_030,
                 message=f"Empty required field 'coo' at row {row}",
                 row=row, field="coo",
             )
 
-        brand = _require_string(sheet, row, c_brand, "brand", merge_tracker)
-        brand_type = _read_brand_type(sheet, row, c_btype, merge_tracker, brand)
-        model_val = _require_string(sheet, row, c_model, "model", merge_tracker)
+        brand = _require_string(sheet, values, row, c_brand, "brand", merge_tracker)
+        brand_type = _read_brand_type(sheet, values, row, c_btype, merge_tracker, brand)
+        model_val = _require_string(sheet, values, row, c_model, "model", merge_tracker)
 
         # Optional: serial.
-        serial_value = _read_optional_string(sheet, row, c_serial, merge_tracker)
+        serial_value = _read_optional_string(sheet, values, row, c_serial, merge_tracker)
 
         # inv_no handling.
-        row_inv_no: str | None = inv_no
+        row_inv_no = batch_inv_no
         if c_inv is not None:
-            inv_raw = _read_optional_string(sheet, row, c_inv, merge_tracker)
-            row_inv_no = _clean_inv_no(inv_raw) if inv_raw is not None else inv_no
-        if row_inv_no is not None:
-            row_inv_no = _clean_inv_no(row_inv_no)
+            inv_raw = _read_optional_string(sheet, values, row, c_inv, merge_tracker)
+            if inv_raw is not None:
+                # Reason: Column values take two prefix passes, so a stacked
+                # "INV# NO." prefix is removed completely.
+                row_inv_no = _clean_inv_no(_clean_inv_no(inv_raw))
 
         # Numeric fields.
-        qty = _read_numeric_field(sheet, row, c_qty, "qty", None, merge_tracker)
-        price = _read_numeric_field(sheet, row, c_price, "price", 5, merge_tracker)
-        amount = _read_numeric_field(sheet, row, c_amount, "amount", 2, merge_tracker)
+        qty = _read_numeric_field(sheet, values, row, c_qty, "qty", None, merge_tracker)
+        price = _read_numeric_field(sheet, values, row, c_price, "price", 5, merge_tracker)
+        amount = _read_numeric_field(sheet, values, row, c_amount, "amount", 2, merge_tracker)
 
         # Step g: Build InvoiceItem.
         items.append(InvoiceItem(
@@ -8,7 +8,9 @@ Implements FR-012, FR-013, FR-014, FR-015, FR-016, FR-017.
 from __future__ import annotations
 
 import logging
+import re
 from decimal import Decimal, InvalidOperation
+from typing import Any
 
 from openpyxl.worksheet.worksheet import Worksheet
 
@@ -18,8 +20,8 @@ from autoconvert.models import ColumnMapping, PackingItem
 from autoconvert.utils import (
     DITTO_MARKS,
     detect_cell_precision,
+    has_stop_keyword,
     is_cell_empty,
-    is_stop_keyword,
     parse_numeric,
     round_half_up,
     strip_unit_suffix,
@@ -27,6 +29,19 @@ from autoconvert.utils import (
 
 logger = logging.getLogger(__name__)
 
+# Stop keywords are searched in columns A-J (FR-012 stop condition 1).
+_STOP_SCAN_COLS = 10
+
+# Pallet/summary row markers, matched case-insensitively anywhere in part_no
+# or in a text NW cell.
+_PALLET_KEYWORDS: tuple[str, ...] = ("plt.", "pallet", "pallets", "棧板", "栈板", "plt")
+_PALLET_RE: re.Pattern[str] = re.compile(
+    "|".join(map(re.escape, _PALLET_KEYWORDS)), re.IGNORECASE
+)
+
+# Bare unit labels in the NW column mark a sub-header or label row.
+_UNIT_LABELS: frozenset[str] = frozenset({"kgs", "kgs.", "kg", "lbs", "lb"})
+
 
 # ---------------------------------------------------------------------------
 # FR-012 — Extract Packing Items
@@ -69,7 +84,7 @@ def _read_numeric_field(
 
 
 def _check_stop_conditions(
-    sheet: Worksheet,
+    values: tuple[Any, ...],
     row: int,
     part_no_col: int,
     nw_col: int,
@@ -85,7 +100,7 @@ def _check_stop_conditions(
     3. Implicit total row (empty part_no + NW>0 + GW>0, excluding merges)
 
     Args:
-        sheet: The packing worksheet.
+        values: The row's values from iter_rows, column 1 first.
         row: Current 1-based row number.
         part_no_col: 1-based column index for part_no.
         nw_col: 1-based column index for nw.
@@ -97,15 +112,13 @@ def _check_stop_conditions(
         True if extraction should stop at this row.
     """
     # Stop condition 1: keyword in columns A-J
-    for col in range(1, 11):
-        cell_val = sheet.cell(row=row, column=col).value
-        if isinstance(cell_val, str) and is_stop_keyword(cell_val):
-            return True
+    if has_stop_keyword(values[:_STOP_SCAN_COLS]):
+        return True
 
     # Read key column values for conditions 2 and 3
-    part_raw = sheet.cell(row=row, column=part_no_col).value
-    nw_raw = sheet.cell(row=row, column=nw_col).value
-    gw_raw = sheet.cell(row=row, column=gw_col).value
+    part_raw = values[part_no_col - 1]
+    nw_raw = values[nw_col - 1]
+    gw_raw = values[gw_col - 1]
 
     part_empty = is_cell_empty(part_raw)
     nw_empty = is_cell_empty(nw_raw)
@@ -120,7 +133,7 @@ def _check_stop_conditions(
     # part_no empty AND nw > 0 AND gw > 0, excluding merge continuations
     if part_empty and not nw_empty and not nw_is_ditto and not gw_empty and not gw_is_ditto:
         # Exclude rows where part_no is empty due to vertical merge
-        if merge_tracker.is_in_merge(row, part_no_col) and not merge_tracker.is_merge_anchor(row, part_no_col):
+        if merge_tracker.is_merge_continuation(row, part_no_col):
             # Merge continuation — not a total row
             pass
         else:
@@ -136,7 +149,7 @@ def _check_stop_conditions(
     # Re-check stop condition 2 (blank row) after implicit total check
     if has_first_data_row and part_empty and (nw_empty or nw_is_ditto) and (gw_empty or gw_is_ditto):
         # Exclude merge continuations for part_no
-        if merge_tracker.is_in_merge(row, part_no_col) and not merge_tracker.is_merge_anchor(row, part_no_col):
+        if merge_tracker.is_merge_continuation(row, part_no_col):
             return False  # Not blank — merge continuation
         return True
 
@@ -180,25 +193,29 @@ def extract_packing_items(
     has_first_data_row = False
     prev_part_no: str | None = None
 
-    for row in range(start_row, sheet.max_row + 1):  # type: ignore[operator]
+    # Reason: One bounded iter_rows pass yields each row's values as a tuple,
+    # wide enough for the A-J stop scan and every mapped column.
+    max_col = max(_STOP_SCAN_COLS, part_no_col, qty_col, nw_col, gw_col)
+    rows = sheet.iter_rows(
+        min_row=start_row, max_row=sheet.max_row, max_col=max_col, values_only=True,
+    )
+
+    for row, values in enumerate(rows, start=start_row):
         # --- STOP CONDITIONS FIRST (CRITICAL ordering) ---
         if _check_stop_conditions(
-            sheet, row, part_no_col, nw_col, gw_col,
+            values, row, part_no_col, nw_col, gw_col,
             merge_tracker, has_first_data_row,
         ):
             break
 
         # --- Read raw values ---
-        part_raw = sheet.cell(row=row, column=part_no_col).value
-        qty_raw = sheet.cell(row=row, column=qty_col).value
-        nw_raw = sheet.cell(row=row, column=nw_col).value
+        part_raw = values[part_no_col - 1]
+        qty_raw = values[qty_col - 1]
+        nw_raw = values[nw_col - 1]
 
         # --- Part_no handling (merge propagation) ---
         part_empty = is_cell_empty(part_raw)
-        is_part_merge_continuation = (
-            merge_tracker.is_in_merge(row, part_no_col)
-            and not merge_tracker.is_merge_anchor(row, part_no_col)
-        )
+        is_part_merge_continuation = merge_tracker.is_merge_continuation(row, part_no_col)
 
         if part_empty and is_part_merge_continuation:
             # Propagate anchor value for vertically merged part_no
@@ -206,15 +223,9 @@ def extract_packing_items(
                 merge_tracker.get_anchor_value(sheet, row, part_no_col)
             ).strip()
         elif part_empty:
-            # Truly empty part_no — not a merge continuation
-            # Check if this is an implicit continuation (same part_no as prev)
-            # If not, it's an error
-            if prev_part_no is not None:
-                # Could be a row we skip (e.g., PO-reference row filtered by
-                # qty=0 AND nw=0 later). But if nw is not empty and not zero,
-                # this is an error.
-                pass
-            # We'll handle below after reading nw/qty
+            # Truly empty part_no — not a merge continuation. Resolved after
+            # NW/QTY are read: implicit continuation of prev_part_no, a
+            # skipped qty=0/nw=0 row (e.g., PO reference), or ERR_030.
             part_no = ""
         else:
             part_no = str(part_raw).strip()
@@ -227,28 +238,22 @@ def extract_packing_items(
         # Reason: Pallet/summary rows can appear with pallet keywords in
         # part_no OR with non-numeric text in NW (e.g., "7 Pallets", "棧板",
         # "12PLT", "KGS"). Both forms must be skipped.
-        _PALLET_KEYWORDS = ("plt.", "pallet", "pallets", "棧板", "栈板", "plt")
-        part_lower = part_no.lower() if part_no else ""
-        if part_lower and any(kw in part_lower for kw in _PALLET_KEYWORDS):
+        if part_no and _PALLET_RE.search(part_no):
             continue
         # Also skip rows where the NW cell is a string that cannot be parsed
         # and contains pallet/unit-label text — these are summary rows.
         if isinstance(nw_raw, str) and not is_cell_empty(nw_raw):
-            nw_stripped_lower = nw_raw.strip().lower()
-            if any(kw in nw_stripped_lower for kw in _PALLET_KEYWORDS):
+            if _PALLET_RE.search(nw_raw):
                 continue
             # Reason: Pure unit labels like "KGS" that slipped through header
             # detection indicate a sub-header or label row, not data.
-            if nw_stripped_lower in ("kgs", "kgs.", "kg", "lbs", "lb"):
+            if nw_raw.strip().lower() in _UNIT_LABELS:
                 continue
 
         # --- NW handling (merge, continuation, ditto) ---
         nw_empty = is_cell_empty(nw_raw)
         nw_is_ditto = isinstance(nw_raw, str) and nw_raw.strip() in DITTO_MARKS
-        is_nw_merge_non_anchor = (
-            merge_tracker.is_in_merge(row, nw_col)
-            and not merge_tracker.is_merge_anchor(row, nw_col)
-        )
+        is_nw_merge_non_anchor = merge_tracker.is_merge_continuation(row, nw_col)
 
         is_first_row_of_merge = True
         nw: Decimal
@@ -288,10 +293,7 @@ def extract_packing_items(
 
         # --- QTY handling (merge, continuation) ---
         qty_empty = is_cell_empty(qty_raw)
-        is_qty_merge_non_anchor = (
-            merge_tracker.is_in_merge(row, qty_col)
-            and not merge_tracker.is_merge_anchor(row, qty_col)
-        )
+        is_qty_merge_non_anchor = merge_tracker.is_merge_continuation(row, qty_col)
 
         qty: Decimal
 
@@ -314,6 +316,7 @@ def extract_packing_items(
                 )
         else:
             qty = _read_numeric_field(qty_raw, "qty", row)
+            # Reason: Only precision detection needs the cell object itself.
             precision = detect_cell_precision(
                 qty_raw, sheet.cell(row=row, column=qty_col).number_format
             )
@@ -143,7 +143,7 @@ def detect_total_row(
         if not is_cell_empty(part_raw):
             continue
         # Exclude merge continuations for part_no
-        if merge_tracker.is_in_merge(row, part_col) and not merge_tracker.is_merge_anchor(row, part_col):
+        if merge_tracker.is_merge_continuation(row, part_col):
             continue
         nw_raw = sheet.cell(row=row, column=nw_col).value
         gw_raw = sheet.cell(row=row, column=gw_col).value
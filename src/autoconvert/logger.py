@@ -7,6 +7,7 @@ Implements FR-031 (real-time console output) and FR-032 (detailed file logging).
 from __future__ import annotations
 
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 
@@ -15,8 +16,10 @@ def _setup_logging_base(log_path: Path, console_level: int) -> None:
     """Configure dual-output logging with a given console level.
 
     Sets up a StreamHandler on stdout at ``console_level`` and a
-    FileHandler at DEBUG level. Clears existing handlers first to
-    prevent duplicate entries on repeated calls.
+    FileHandler at DEBUG level. File records are buffered in a
+    MemoryHandler and written when ``flush_log_handlers()`` is called
+    (once per processed file) or at interpreter exit. Clears existing
+    handlers first to prevent duplicate entries on repeated calls.
 
     Args:
         log_path: Path to the log file (e.g., process_log.txt).
@@ -47,7 +50,14 @@ def _setup_logging_base(log_path: Path, console_level: int) -> None:
             "[%(asctime)s] [%(levelname)s] %(message)s", datefmt="%H:%M"
         )
         file_handler.setFormatter(file_formatter)
-        logging.root.addHandler(file_handler)
+
+        # Reason: Writing each DEBUG record straight to disk serializes file
+        # I/O with parsing; buffer and flush at file boundaries instead.
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=1000, flushLevel=logging.CRITICAL, target=file_handler,
+        )
+        buffered_handler.setLevel(logging.DEBUG)
+        logging.root.addHandler(buffered_handler)
     except OSError as e:
         # Log write failure to console but continue processing
         logging.warning(f"Failed to create log file at {log_path}: {e}")
@@ -84,3 +94,13 @@ def setup_diagnostic_logging(log_path: Path) -> None:
         None
     """
     _setup_logging_base(log_path, logging.DEBUG)
+
+
+def flush_log_handlers() -> None:
+    """Flush all root logging handlers, writing any buffered file records.
+
+    Returns:
+        None
+    """
+    for handler in logging.root.handlers:
+        handler.flush()
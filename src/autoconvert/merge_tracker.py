@@ -29,6 +29,8 @@ class MergeTracker:
         _ranges: All captured MergeRange objects.
         _cell_to_range: Maps every (row, col) tuple within a merge range
             to its owning MergeRange for O(1) lookup.
+        _continuation_cells: Every (row, col) inside a merge range except
+            the range's anchor.
     """
 
     def __init__(self, sheet: Worksheet) -> None:
@@ -36,7 +38,8 @@ class MergeTracker:
 
         Steps (order is critical):
         1. Snapshot all current merged cell ranges as MergeRange objects.
-        2. Build _cell_to_range lookup for every cell in each range.
+        2. Build _cell_to_range lookup for every cell in each range, and
+           the _continuation_cells set of its non-anchor cells.
         3. Unmerge all cells from the snapshot (never iterate the live
            collection while modifying it).
 
@@ -50,6 +53,7 @@ class MergeTracker:
         """
         self._ranges: list[MergeRange] = []
         self._cell_to_range: dict[tuple[int, int], MergeRange] = {}
+        self._continuation_cells: set[tuple[int, int]] = set()
 
         # Step 1 & 2: snapshot ranges and build lookup BEFORE any unmerging.
         # sheet.merged_cells.ranges needs type: ignore due to incomplete stubs
@@ -71,6 +75,8 @@ class MergeTracker:
             for r in range(merge_range.min_row, merge_range.max_row + 1):
                 for c in range(merge_range.min_col, merge_range.max_col + 1):
                     self._cell_to_range[(r, c)] = merge_range
+                    self._continuation_cells.add((r, c))
+            self._continuation_cells.discard((merge_range.min_row, merge_range.min_col))
 
         # Step 3: unmerge from the snapshot list (not from the live collection)
         # to avoid mutating the iterable during iteration.
@@ -113,6 +119,24 @@ class MergeTracker:
         """
         return (row, col) in self._cell_to_range
 
+    def is_merge_continuation(self, row: int, col: int) -> bool:
+        """Return True if (row, col) is a non-anchor cell of a merge range.
+
+        Equivalent to ``is_in_merge(row, col) and not is_merge_anchor(row,
+        col)`` but answered with one set lookup, since extractors ask this
+        for several columns of every data row.
+
+        Args:
+            row: 1-based row index.
+            col: 1-based column index.
+
+        Returns:
+            True if the cell lies in a merge range and is not its anchor;
+            False for anchors and for cells not in any merge range.
+        """
+        # Reason: Most sheets have no merges; skip building and hashing the key.
+        return bool(self._continuation_cells) and (row, col) in self._continuation_cells
+
     def get_anchor_value(self, sheet: Worksheet, row: int, col: int) -> Any:
         """Return the anchor cell's value for any cell in a merge range.
 
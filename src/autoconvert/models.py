@@ -281,12 +281,13 @@ class AppConfig(BaseModel):
 class SheetPair(BaseModel):
     """Holds the detected invoice and packing worksheet objects for one file.
 
-    Accepts both openpyxl Worksheet and the xlrd adapter (which wraps an
-    xlrd.Sheet). Using Any is intentional to support both backends.
+    Accepts both openpyxl Worksheet and SheetSnapshot (the in-memory form
+    batch.py builds for .xlsx and .xls files). Using Any is intentional to
+    support both.
 
     Attributes:
-        invoice_sheet: openpyxl Worksheet or xlrd Sheet adapter for the invoice.
-        packing_sheet: openpyxl Worksheet or xlrd Sheet adapter for the packing.
+        invoice_sheet: openpyxl Worksheet or SheetSnapshot for the invoice.
+        packing_sheet: openpyxl Worksheet or SheetSnapshot for the packing.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
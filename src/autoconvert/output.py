@@ -14,6 +14,7 @@ from openpyxl.worksheet.worksheet import Worksheet
 
 from autoconvert.errors import ErrorCode, ProcessingError
 from autoconvert.models import AppConfig, InvoiceItem, PackingTotals
+from autoconvert.utils import TEMPLATE_SHEET_NAME
 
 logger = logging.getLogger(__name__)
 
@@ -51,9 +52,6 @@ _FIXED_DOMESTIC_DEST = "32052"
 _FIXED_ADMIN_DIST = "320506"
 _FIXED_FINAL_DEST = "142"
 
-# Sheet name (must match template exactly)
-_SHEET_NAME = "工作表1"
-
 # First data row (template rows 1-4 are header rows)
 _FIRST_DATA_ROW = 5
 
@@ -93,16 +91,16 @@ def write_template(
         ) from exc
 
     # --- Step 2: Select sheet ---
-    if _SHEET_NAME not in workbook.sheetnames:
+    if TEMPLATE_SHEET_NAME not in workbook.sheetnames:
         raise ProcessingError(
             code=ErrorCode.ERR_051,
             message=(
-                f"TEMPLATE_LOAD_FAILED: Sheet '{_SHEET_NAME}' not found in "
+                f"TEMPLATE_LOAD_FAILED: Sheet '{TEMPLATE_SHEET_NAME}' not found in "
                 f"template '{config.output_template_path}'. "
                 f"Available sheets: {workbook.sheetnames}"
             ),
         )
-    sheet: Worksheet = workbook[_SHEET_NAME]  # type: ignore[assignment]
+    sheet: Worksheet = workbook[TEMPLATE_SHEET_NAME]  # type: ignore[assignment]
 
     # --- Steps 3-6: Write data rows ---
     for row_idx, item in enumerate(invoice_items, start=_FIRST_DATA_ROW):
@@ -12,11 +12,14 @@ from openpyxl.workbook.workbook import Workbook
 
 from autoconvert.errors import ErrorCode, ProcessingError
 from autoconvert.models import AppConfig, SheetPair
+from autoconvert.sheet_snapshot import WorkbookSnapshot
 
 logger = logging.getLogger(__name__)
 
 
-def detect_sheets(workbook: Workbook, config: AppConfig) -> SheetPair:
+def detect_sheets(
+    workbook: Workbook | WorkbookSnapshot, config: AppConfig,
+) -> SheetPair:
     """Scan all sheet names in workbook against configured regex patterns.
 
     Scans each sheet name in the workbook (stripped of whitespace) against
@@ -24,7 +27,8 @@ def detect_sheets(workbook: Workbook, config: AppConfig) -> SheetPair:
     First match wins. Both invoice and packing sheets must be found.
 
     Args:
-        workbook: openpyxl Workbook object (already opened by batch.py).
+        workbook: WorkbookSnapshot (as opened by batch.py) or an openpyxl
+            Workbook.
         config: AppConfig with compiled invoice_sheet_patterns and
             packing_sheet_patterns (case-insensitive, pre-compiled by config.py).
 
@@ -39,11 +43,7 @@ def detect_sheets(workbook: Workbook, config: AppConfig) -> SheetPair:
     invoice_sheet = None
     packing_sheet = None
 
-    # Reason: Iterate workbook._sheets directly (not workbook.worksheets)
-    # because openpyxl's .worksheets property filters by isinstance(Worksheet),
-    # which excludes XlrdSheetAdapter objects placed in _sheets for .xls support.
-    sheets = workbook._sheets  # type: ignore[attr-defined]
-    for ws in sheets:
+    for ws in workbook.worksheets:
         sheet_name_stripped = ws.title.strip()
 
         # Check invoice patterns (if not already found).
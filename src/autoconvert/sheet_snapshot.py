@@ -0,0 +1,307 @@
+"""In-memory worksheet snapshot shared by the .xlsx and .xls readers.
+
+Materializes a read_only openpyxl worksheet or an xlrd sheet in one pass so
+that downstream extraction modules use openpyxl-style
+``sheet.cell(row, column)`` random access, 1-based, regardless of file
+format and after the workbook has been closed. For .xlsx, merged-cell
+ranges are captured during the same pass. WorkbookSnapshot groups the
+sheets of one file.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+from openpyxl.cell.read_only import ReadOnlyCell
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from openpyxl.worksheet._reader import WorkSheetParser
+from openpyxl.worksheet.cell_range import CellRange
+
+
+class _CellProxy:
+    """Minimal cell proxy matching openpyxl Cell.value and number_format.
+
+    Attributes:
+        value: The cached cell value.
+        number_format: The cell's number format string.
+    """
+
+    __slots__ = ("value", "number_format")
+
+    def __init__(self, value: Any, number_format: str) -> None:
+        """Initialize a cell proxy.
+
+        Args:
+            value: The cell value.
+            number_format: The openpyxl number format string.
+        """
+        self.value = value
+        self.number_format = number_format
+
+
+_EMPTY_CELL = _CellProxy(None, "General")
+
+
+class _MergedCells:
+    """Container exposing merged ranges via the openpyxl ``.ranges`` attribute.
+
+    Attributes:
+        ranges: CellRange objects captured from the worksheet XML.
+    """
+
+    __slots__ = ("ranges",)
+
+    def __init__(self, ranges: list[CellRange]) -> None:
+        """Initialize the container.
+
+        Args:
+            ranges: Merged cell ranges in document order.
+        """
+        self.ranges = ranges
+
+
+class SheetSnapshot:
+    """Read-only, fully materialized view of one worksheet.
+
+    Provides the subset of the openpyxl Worksheet interface used by the
+    extraction pipeline. Non-anchor cells of merged ranges are dropped at
+    construction, matching what openpyxl shows after ``unmerge_cells``.
+
+    Values are held as one list per row so that ``cell()`` and
+    ``iter_rows()`` are plain list indexing. Rows are ragged: each list
+    stops at its last stored cell, so sparse sheets stay small.
+
+    Attributes:
+        title: Sheet name string.
+        max_row: Largest 1-based row index holding a cell (1 if empty).
+        max_column: Largest 1-based column index holding a cell (1 if empty).
+        merged_cells: Container with the captured merged ranges.
+        _rows: Row-major cell values; ``_rows[r - 1][c - 1]`` is (r, c).
+        _formats: Maps (row, col) to number format, for non-"General" cells.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        cells: dict[tuple[int, int], tuple[Any, str]],
+        merged_ranges: list[CellRange],
+        max_row: int | None = None,
+        max_column: int | None = None,
+    ) -> None:
+        """Initialize the snapshot from already-parsed cell data.
+
+        Args:
+            title: Sheet name string.
+            cells: Maps 1-based (row, col) to (value, number_format).
+            merged_ranges: Merged cell ranges captured from the sheet.
+            max_row: Explicit row count, or None to derive it from cells.
+            max_column: Explicit column count, or None to derive it from cells.
+        """
+        # Reason: openpyxl empties non-anchor merged cells on load and deletes
+        # them on unmerge; drop them here so reads match the writable path.
+        for rng in merged_ranges:
+            for coord in rng.cells:
+                if coord != (rng.min_row, rng.min_col):
+                    cells.pop(coord, None)
+
+        self.title = title
+        self.merged_cells = _MergedCells(merged_ranges)
+
+        widths: dict[int, int] = {}
+        for r, c in cells:
+            if c > widths.get(r, 0):
+                widths[r] = c
+        self.max_row: int = (
+            max_row if max_row is not None else max(widths, default=1)
+        )
+        self.max_column: int = (
+            max_column if max_column is not None
+            else max(widths.values(), default=1)
+        )
+
+        rows: list[list[Any]] = [
+            [None] * widths.get(r, 0) for r in range(1, max(widths, default=0) + 1)
+        ]
+        formats: dict[tuple[int, int], str] = {}
+        for (r, c), (value, fmt) in cells.items():
+            rows[r - 1][c - 1] = value
+            if fmt != "General":
+                formats[(r, c)] = fmt
+        self._rows = rows
+        self._formats = formats
+
+    @classmethod
+    def from_read_only(cls, ws: ReadOnlyWorksheet) -> SheetSnapshot:
+        """Materialize a ReadOnlyWorksheet in a single XML pass.
+
+        Args:
+            ws: A worksheet from a workbook opened with ``read_only=True``.
+                Its workbook archive must still be open.
+
+        Returns:
+            SheetSnapshot holding every cell value, number format, and
+            merged range of the sheet.
+        """
+        wb = ws.parent
+        cells: dict[tuple[int, int], tuple[Any, str]] = {}
+        formats: dict[int, str] = {}
+
+        # Reason: ReadOnlyWorksheet.iter_rows does not expose merged ranges.
+        # Driving the sheet parser directly (as iter_rows does internally)
+        # yields both cells and <mergeCells> from one pass over the XML.
+        with ws._get_source() as src:
+            parser = WorkSheetParser(
+                src,
+                ws._shared_strings,
+                data_only=wb.data_only,
+                epoch=wb.epoch,
+                date_formats=wb._date_formats,
+                timedelta_formats=wb._timedelta_formats,
+            )
+            for _, row in parser.parse():
+                for cell in row:
+                    style_id = cell["style_id"]
+                    fmt = formats.get(style_id)
+                    if fmt is None:
+                        fmt = ReadOnlyCell(ws, 0, 0, None, style_id=style_id).number_format
+                        formats[style_id] = fmt
+                    cells[(cell["row"], cell["column"])] = (cell["value"], fmt)
+
+            merged_ranges: list[CellRange] = []
+            if parser.merged_cells is not None:
+                merged_ranges = [
+                    CellRange(mc.ref) for mc in parser.merged_cells.mergeCell
+                ]
+
+        return cls(ws.title, cells, merged_ranges)
+
+    @classmethod
+    def from_xlrd(cls, sheet: Any) -> SheetSnapshot:
+        """Materialize an xlrd sheet, converting to 1-based indices.
+
+        xlrd's empty-string cells become absent (read as None, matching
+        openpyxl). Number formats are always "General" and no merged ranges
+        are reported, since xlrd is opened without formatting_info.
+
+        Args:
+            sheet: An xlrd.sheet.Sheet object.
+
+        Returns:
+            SheetSnapshot whose dimensions equal xlrd's nrows/ncols.
+        """
+        cells: dict[tuple[int, int], tuple[Any, str]] = {}
+        for r in range(sheet.nrows):
+            for c, value in enumerate(sheet.row_values(r), start=1):
+                if value != "":
+                    cells[(r + 1, c)] = (value, "General")
+        return cls(
+            sheet.name, cells, [], max_row=sheet.nrows, max_column=sheet.ncols,
+        )
+
+    def cell(self, row: int = 1, column: int = 1) -> _CellProxy:
+        """Return the cell at 1-based (row, column).
+
+        Args:
+            row: 1-based row index.
+            column: 1-based column index.
+
+        Returns:
+            A _CellProxy with .value and .number_format attributes; an
+            empty proxy (value None, "General") for cells not present.
+        """
+        if 0 < row <= len(self._rows):
+            values = self._rows[row - 1]
+            if 0 < column <= len(values):
+                fmt = self._formats.get((row, column), "General")
+                return _CellProxy(values[column - 1], fmt)
+        return _EMPTY_CELL
+
+    def iter_rows(
+        self,
+        min_row: int | None = None,
+        max_row: int | None = None,
+        min_col: int | None = None,
+        max_col: int | None = None,
+        values_only: bool = False,
+    ) -> Iterator[tuple[Any, ...]]:
+        """Yield rows of the sheet, mirroring openpyxl ``Worksheet.iter_rows``.
+
+        Bounds default to the sheet dimensions. Rows and columns past the
+        stored data are padded with None (or empty cells).
+
+        Args:
+            min_row: First 1-based row, default 1.
+            max_row: Last 1-based row, default max_row.
+            min_col: First 1-based column, default 1.
+            max_col: Last 1-based column, default max_column.
+            values_only: Yield raw values instead of cell proxies.
+
+        Yields:
+            One tuple per row with ``max_col - min_col + 1`` entries.
+        """
+        min_row = min_row or 1
+        max_row = max_row or self.max_row
+        min_col = min_col or 1
+        max_col = max_col or self.max_column
+        if not values_only:
+            for r in range(min_row, max_row + 1):
+                yield tuple(self.cell(r, c) for c in range(min_col, max_col + 1))
+            return
+
+        width = max_col - min_col + 1
+        stored = len(self._rows)
+        for r in range(min_row, max_row + 1):
+            values = self._rows[r - 1] if r <= stored else []
+            row = tuple(values[min_col - 1:max_col])
+            if len(row) < width:
+                row += (None,) * (width - len(row))
+            yield row
+
+    def unmerge_cells(self, range_string: str) -> None:
+        """Accept MergeTracker's unmerge call; the snapshot is already unmerged.
+
+        Args:
+            range_string: Merged range coordinate string (ignored).
+        """
+
+
+class WorkbookSnapshot:
+    """Closed-file workbook holding SheetSnapshot objects in sheet order.
+
+    Provides the subset of the openpyxl Workbook interface used by sheet
+    detection: ``worksheets``, ``sheetnames``, and lookup by name.
+
+    Attributes:
+        worksheets: Snapshots in workbook order.
+    """
+
+    def __init__(self, worksheets: list[SheetSnapshot]) -> None:
+        """Initialize the workbook from already-materialized sheets.
+
+        Args:
+            worksheets: Snapshots in workbook order.
+        """
+        self.worksheets = worksheets
+
+    @property
+    def sheetnames(self) -> list[str]:
+        """Sheet titles in workbook order."""
+        return [ws.title for ws in self.worksheets]
+
+    def __getitem__(self, name: str) -> SheetSnapshot:
+        """Return the sheet titled ``name``.
+
+        Args:
+            name: Exact sheet title.
+
+        Returns:
+            The matching SheetSnapshot.
+
+        Raises:
+            KeyError: If no sheet has that title.
+        """
+        for ws in self.worksheets:
+            if ws.title == name:
+                return ws
+        raise KeyError(f"Worksheet {name} does not exist.")
@@ -1,6 +1,7 @@
 """Data transformation for AutoConvert.
 
-Converts currency codes, country codes, and cleans PO numbers.
+Converts currency codes, country codes, and cleans PO numbers, either as
+separate passes or fused into one via transform_invoice_items.
 Implements FR-018, FR-019, FR-020.
 """
 
@@ -47,36 +48,12 @@ def convert_currency(
     warnings: list[ProcessingError] = []
 
     for item in items:
-        normalized_key = normalize_lookup_key(item.currency)
-        target_code = config.currency_lookup.get(normalized_key)
-
-        if target_code is not None:
-            new_item = item.model_copy(update={"currency": target_code})
-            logger.debug(
-                "convert_currency: '%s' -> '%s' (row %s)",
-                item.currency,
-                target_code,
-                item.inv_no,
-            )
+        currency, warning = _convert_currency_value(item, config)
+        if warning is None:
+            updated.append(item.model_copy(update={"currency": currency}))
         else:
-            new_item = item.model_copy()
-            warning = ProcessingError(
-                code=WarningCode.ATT_003,
-                message=(
-                    f"Unstandardized currency '{item.currency}': "
-                    f"no match found in currency lookup table. "
-                    f"Raw value preserved."
-                ),
-                filename=None,
-                row=None,
-                field="currency",
-            )
             warnings.append(warning)
-            logger.warning(
-                "convert_currency: no match for '%s' (ATT_003)", item.currency
-            )
-
-        updated.append(new_item)
+            updated.append(item.model_copy())
 
     return updated, warnings
 
@@ -110,36 +87,12 @@ def convert_country(
     warnings: list[ProcessingError] = []
 
     for item in items:
-        normalized_key = normalize_lookup_key(item.coo)
-        target_code = config.country_lookup.get(normalized_key)
-
-        if target_code is not None:
-            # Reason: spec says Target_Code may be stored as int in the source
-            # xlsx; config normalizes to str at load time, but we cast anyway
-            # to be safe against future config changes.
-            new_item = item.model_copy(update={"coo": str(target_code)})
-            logger.debug(
-                "convert_country: '%s' -> '%s'", item.coo, target_code
-            )
+        coo, warning = _convert_country_value(item, config)
+        if warning is None:
+            updated.append(item.model_copy(update={"coo": coo}))
         else:
-            new_item = item.model_copy()
-            warning = ProcessingError(
-                code=WarningCode.ATT_004,
-                message=(
-                    f"Unstandardized COO '{item.coo}': "
-                    f"no match found in country lookup table. "
-                    f"Raw value preserved."
-                ),
-                filename=None,
-                row=None,
-                field="coo",
-            )
             warnings.append(warning)
-            logger.warning(
-                "convert_country: no match for '%s' (ATT_004)", item.coo
-            )
-
-        updated.append(new_item)
+            updated.append(item.model_copy())
 
     return updated, warnings
 
@@ -167,27 +120,162 @@ def clean_po_number(items: list[InvoiceItem]) -> list[InvoiceItem]:
     Returns:
         New list of InvoiceItem copies with cleaned po_no values.
     """
+    return [
+        item.model_copy(update={"po_no": _clean_po_value(item.po_no)})
+        for item in items
+    ]
+
+
+def transform_invoice_items(
+    items: list[InvoiceItem],
+    config: AppConfig,
+) -> tuple[list[InvoiceItem], list[ProcessingError]]:
+    """Apply currency, country, and PO-number transforms in one pass.
+
+    Equivalent to convert_currency, then convert_country, then
+    clean_po_number, but walks ``items`` once and makes a single copy of
+    each item.  Warnings keep the sequential order: every ATT_003 warning
+    precedes every ATT_004 warning.
+
+    Does NOT raise on no-match.  Does NOT mutate the input list.
+
+    Args:
+        items: List of extracted InvoiceItem objects.
+        config: AppConfig carrying currency_lookup and country_lookup.
+
+    Returns:
+        A tuple of (updated_items, warnings) with one transformed copy per
+        input item and the ATT_003/ATT_004 warnings for unmatched values.
+    """
     updated: list[InvoiceItem] = []
+    currency_warnings: list[ProcessingError] = []
+    country_warnings: list[ProcessingError] = []
 
     for item in items:
-        match = _PO_DELIMITER_RE.search(item.po_no)
+        changes: dict[str, str] = {}
 
-        if match is None:
-            # No delimiter found — copy item unchanged.
-            updated.append(item.model_copy())
+        currency, warning = _convert_currency_value(item, config)
+        if warning is None:
+            changes["currency"] = currency
         else:
-            cleaned = item.po_no[: match.start()]
-            if cleaned == "":
-                # Delimiter at position 0: preserve original (FR-020 edge case).
-                logger.debug(
-                    "clean_po_number: delimiter at index 0 for '%s', preserving",
-                    item.po_no,
-                )
-                updated.append(item.model_copy())
-            else:
-                logger.debug(
-                    "clean_po_number: '%s' -> '%s'", item.po_no, cleaned
-                )
-                updated.append(item.model_copy(update={"po_no": cleaned}))
-
-    return updated
+            currency_warnings.append(warning)
+
+        coo, warning = _convert_country_value(item, config)
+        if warning is None:
+            changes["coo"] = coo
+        else:
+            country_warnings.append(warning)
+
+        changes["po_no"] = _clean_po_value(item.po_no)
+        updated.append(item.model_copy(update=changes))
+
+    return updated, currency_warnings + country_warnings
+
+
+def _convert_currency_value(
+    item: InvoiceItem, config: AppConfig,
+) -> tuple[str, ProcessingError | None]:
+    """Look up one item's currency in config.currency_lookup (FR-018).
+
+    Args:
+        item: Invoice item carrying the raw currency string.
+        config: AppConfig carrying the normalized currency_lookup dict.
+
+    Returns:
+        Tuple of (currency, warning): the target code and None on match,
+        or the raw value and an ATT_003 warning on no-match.
+    """
+    normalized_key = normalize_lookup_key(item.currency)
+    target_code = config.currency_lookup.get(normalized_key)
+
+    if target_code is not None:
+        logger.debug(
+            "convert_currency: '%s' -> '%s' (row %s)",
+            item.currency,
+            target_code,
+            item.inv_no,
+        )
+        return target_code, None
+
+    logger.warning(
+        "convert_currency: no match for '%s' (ATT_003)", item.currency
+    )
+    return item.currency, ProcessingError(
+        code=WarningCode.ATT_003,
+        message=(
+            f"Unstandardized currency '{item.currency}': "
+            f"no match found in currency lookup table. "
+            f"Raw value preserved."
+        ),
+        filename=None,
+        row=None,
+        field="currency",
+    )
+
+
+def _convert_country_value(
+    item: InvoiceItem, config: AppConfig,
+) -> tuple[str, ProcessingError | None]:
+    """Look up one item's COO in config.country_lookup (FR-019).
+
+    Args:
+        item: Invoice item carrying the raw COO string.
+        config: AppConfig carrying the normalized country_lookup dict.
+
+    Returns:
+        Tuple of (coo, warning): the target code and None on match, or the
+        raw value and an ATT_004 warning on no-match.
+    """
+    normalized_key = normalize_lookup_key(item.coo)
+    target_code = config.country_lookup.get(normalized_key)
+
+    if target_code is not None:
+        logger.debug(
+            "convert_country: '%s' -> '%s'", item.coo, target_code
+        )
+        # Reason: spec says Target_Code may be stored as int in the source
+        # xlsx; config normalizes to str at load time, but we cast anyway
+        # to be safe against future config changes.
+        return str(target_code), None
+
+    logger.warning(
+        "convert_country: no match for '%s' (ATT_004)", item.coo
+    )
+    return item.coo, ProcessingError(
+        code=WarningCode.ATT_004,
+        message=(
+            f"Unstandardized COO '{item.coo}': "
+            f"no match found in country lookup table. "
+            f"Raw value preserved."
+        ),
+        filename=None,
+        row=None,
+        field="coo",
+    )
+
+
+def _clean_po_value(po_no: str) -> str:
+    """Strip a PO number from its first delimiter onwards (FR-020).
+
+    Args:
+        po_no: Raw PO number string.
+
+    Returns:
+        The cleaned PO number, or ``po_no`` unchanged when it has no
+        delimiter or the delimiter is at position 0.
+    """
+    match = _PO_DELIMITER_RE.search(po_no)
+    if match is None:
+        return po_no
+
+    cleaned = po_no[: match.start()]
+    if cleaned == "":
+        # Delimiter at position 0: preserve original (FR-020 edge case).
+        logger.debug(
+            "clean_po_number: delimiter at index 0 for '%s', preserving",
+            po_no,
+        )
+        return po_no
+
+    logger.debug("clean_po_number: '%s' -> '%s'", po_no, cleaned)
+    return cleaned
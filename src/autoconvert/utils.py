@@ -7,8 +7,10 @@ No file I/O, no logging, no global state mutation.
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
-from typing import Any
+from functools import lru_cache
+from typing import Any, Final
 
 from autoconvert.errors import ErrorCode, ProcessingError
 
@@ -25,6 +27,9 @@ FOOTER_KEYWORDS: tuple[str, ...] = ("报关行", "有限公司", "口岸关别",
 PLACEHOLDER_PATTERN: re.Pattern[str] = re.compile(r'^[/\\*\-\u2014]+$')
 """Pre-compiled regex for placeholder detection: strings of /, \\, *, -, or em-dash."""
 
+TEMPLATE_SHEET_NAME: Final = "工作表1"
+"""Worksheet name the output template must contain and output writes to."""
+
 # Regex for stripping trailing unit suffixes (longest match first to avoid partial stripping).
 _UNIT_SUFFIX_RE: re.Pattern[str] = re.compile(
     r'(?:KGS|KG|LBS|LB|PCS|EA|件|个|G)\s*$',
@@ -34,12 +39,22 @@ _UNIT_SUFFIX_RE: re.Pattern[str] = re.compile(
 # Stop keywords for total row detection (case-insensitive).
 _STOP_KEYWORDS: tuple[str, ...] = ("total", "合计", "总计", "小计")
 
+# Reason: One alternation scans each cell once in C instead of lowercasing
+# it and running a Python loop of substring tests; IGNORECASE on these
+# keywords matches exactly what `keyword in value.lower()` did.
+_STOP_KEYWORD_RE: re.Pattern[str] = re.compile(
+    "|".join(map(re.escape, _STOP_KEYWORDS)), re.IGNORECASE,
+)
+
 
 # ---------------------------------------------------------------------------
 # Functions
 # ---------------------------------------------------------------------------
 
 
+# Reason: Invoice columns repeat the same strings row after row (currency,
+# brand, COO, unit-suffixed quantities); both helpers below are pure.
+@lru_cache(maxsize=4096)
 def strip_unit_suffix(value: str) -> str:
     """Strip trailing unit suffixes and whitespace from a string value.
 
@@ -70,8 +85,22 @@ def round_half_up(value: Decimal, decimals: int) -> Decimal:
     Returns:
         Decimal quantized to the specified number of decimal places.
     """
-    quantizer = Decimal(10) ** -decimals
-    return value.quantize(quantizer, rounding=ROUND_HALF_UP)
+    return value.quantize(_quantizer(decimals), rounding=ROUND_HALF_UP)
+
+
+# Reason: Only a handful of precisions (0-5) are ever used, and computing
+# Decimal(10) ** -n costs more than the quantize call itself.
+@lru_cache(maxsize=None)
+def _quantizer(decimals: int) -> Decimal:
+    """Return the quantize exponent Decimal for a number of decimal places.
+
+    Args:
+        decimals: Number of decimal places (>= 0).
+
+    Returns:
+        Decimal(10) ** -decimals.
+    """
+    return Decimal(10) ** -decimals
 
 
 def parse_numeric(value: Any, field_name: str, row: int) -> Decimal:
@@ -118,6 +147,7 @@ def parse_numeric(value: Any, field_name: str, row: int) -> Decimal:
     )
 
 
+@lru_cache(maxsize=4096)
 def is_placeholder(value: str) -> bool:
     """Check whether a string value is a placeholder.
 
@@ -149,6 +179,21 @@ def detect_cell_precision(cell_value: Any, number_format: str) -> int:
             future General-format value-based precision if needed).
         number_format: The openpyxl number_format string from the cell.
 
+    Returns:
+        Integer number of decimal places (0 to 5).
+    """
+    return _format_precision(number_format)
+
+
+# Reason: A sheet uses only a few distinct number formats, but precision is
+# detected for every numeric cell; parse each format string once.
+@lru_cache(maxsize=256)
+def _format_precision(number_format: str) -> int:
+    """Count the decimal places of an openpyxl number format string.
+
+    Args:
+        number_format: The openpyxl number_format string from the cell.
+
     Returns:
         Integer number of decimal places (0 to 5).
     """
@@ -175,12 +220,15 @@ def detect_cell_precision(cell_value: Any, number_format: str) -> int:
     return min(count, 5)
 
 
-
+# Reason: Header texts repeat heavily across rows, sheets, and files; the
+# function is pure, so memoizing it is safe.
+@lru_cache(maxsize=1024)
 def normalize_header(value: str) -> str:
     """Normalize a column header string for regex matching.
 
     Collapses newlines, tabs, and multiple spaces to a single space,
     strips leading/trailing whitespace, and returns lowercased string.
+    Results are memoized per input string.
 
     Args:
         value: The raw header string from an Excel cell.
@@ -201,7 +249,7 @@ def is_cell_empty(value: object) -> bool:
     treated as empty (no data present).
 
     Args:
-        value: Raw cell value from openpyxl or an xlrd adapter.
+        value: Raw cell value from openpyxl or a SheetSnapshot.
 
     Returns:
         True when the value is None or a string containing only whitespace.
@@ -225,10 +273,21 @@ def is_stop_keyword(value: str) -> bool:
     Returns:
         True if the value contains any stop keyword, False otherwise.
     """
-    if not value:
-        return False
-    lowered = value.lower()
-    for keyword in _STOP_KEYWORDS:
-        if keyword in lowered:
-            return True
-    return False
+    return _STOP_KEYWORD_RE.search(value) is not None
+
+
+def has_stop_keyword(values: Iterable[Any]) -> bool:
+    """Check whether any string among a row's cell values contains a stop keyword.
+
+    Equivalent to calling is_stop_keyword on each string value, but joins
+    the strings and searches them once. Non-string values are ignored.
+
+    Args:
+        values: Cell values, typically one row's columns A-J.
+
+    Returns:
+        True if any string value contains a stop keyword, False otherwise.
+    """
+    # Reason: No keyword contains NUL, so a match can never span two cells.
+    joined = "\0".join([v for v in values if isinstance(v, str)])
+    return _STOP_KEYWORD_RE.search(joined) is not None
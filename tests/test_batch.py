@@ -16,8 +16,8 @@ from unittest.mock import patch
 import openpyxl
 
 from autoconvert.batch import process_file, run_batch
-from autoconvert.errors import ErrorCode
-from autoconvert.models import AppConfig
+from autoconvert.errors import ErrorCode, ProcessingError
+from autoconvert.models import AppConfig, PackingTotals
 
 # ---------------------------------------------------------------------------
 # Helpers — minimal workbook builder for process_file tests
@@ -204,15 +204,18 @@ class TestRunBatch:
         finished_dir = data_dir / "finished"
         finished_dir.mkdir(parents=True)
 
-        # Place a dummy file in finished/
+        # Place a dummy file and a subdirectory in finished/
         dummy = finished_dir / "old_output.xlsx"
         dummy.write_text("dummy")
+        subdir = finished_dir / "archive"
+        subdir.mkdir()
 
         assert dummy.exists()
 
         run_batch(config, data_dir)
 
         assert not dummy.exists()
+        assert subdir.is_dir()
 
     def test_run_batch_skips_clear_in_diagnostic_mode(
         self, tmp_path: Path,
@@ -227,7 +230,7 @@ class TestRunBatch:
         dummy = finished_dir / "existing_output.xlsx"
         dummy.write_text("dummy")
 
-        run_batch(config, data_dir, diagnostic_file=str(filepath))
+        run_batch(config, data_dir, diagnostic_path=filepath)
 
         assert dummy.exists()
 
@@ -249,6 +252,24 @@ class TestRunBatch:
         assert "vendor.xlsx" in processed_names
         assert "~$vendor.xlsx" not in processed_names
 
+    def test_run_batch_scan_is_case_insensitive_and_skips_dirs(
+        self, tmp_path: Path,
+    ) -> None:
+        """Upper-case suffixes are picked up; directories and other files are not."""
+        config = _make_minimal_config()
+        data_dir = tmp_path / "data"
+        data_dir.mkdir(parents=True)
+        (data_dir / "finished").mkdir()
+
+        _build_test_workbook(tmp_path, "VENDOR.XLSX")
+        (data_dir / "folder.xlsx").mkdir()
+        (data_dir / "notes.txt").write_text("x")
+        (data_dir / ".hidden.xlsx").write_text("x")
+
+        result = run_batch(config, data_dir)
+
+        assert [r.filename for r in result.file_results] == ["VENDOR.XLSX"]
+
     def test_run_batch_file_locked_skipped_with_err010(
         self, tmp_path: Path,
     ) -> None:
@@ -320,6 +341,57 @@ class TestRunBatch:
         assert result.failed_count >= 1
         assert result.success_count + result.attention_count + result.failed_count == result.total_files
 
+    def test_run_batch_results_sorted_by_filename(self, tmp_path: Path) -> None:
+        """Files are processed and reported in name order, not creation order."""
+        config = _make_minimal_config()
+        data_dir = tmp_path / "data"
+        data_dir.mkdir(parents=True)
+        (data_dir / "finished").mkdir()
+
+        for name in ("c.xlsx", "a.xlsx", "b.xlsx"):
+            _build_test_workbook(tmp_path, name)
+
+        with patch("autoconvert.batch.process_file", wraps=process_file) as spy:
+            result = run_batch(config, data_dir)
+
+        processed = [call.args[0].name for call in spy.call_args_list]
+        assert processed == ["a.xlsx", "b.xlsx", "c.xlsx"]
+        assert [r.filename for r in result.file_results] == processed
+
+    def test_run_batch_reports_given_log_path(self, tmp_path: Path) -> None:
+        """Verify log_path defaults beside data_dir and honors an override."""
+        config = _make_minimal_config()
+        data_dir = tmp_path / "data"
+
+        default = run_batch(config, data_dir)
+        custom = run_batch(config, data_dir, log_path=tmp_path / "logs" / "run.txt")
+
+        assert default.log_path == str(tmp_path / "process_log.txt")
+        assert custom.log_path == str(tmp_path / "logs" / "run.txt")
+
+    def test_run_batch_parallel_matches_serial(self, tmp_path: Path) -> None:
+        """Verify jobs > 1 yields the same per-file outcomes in the same order."""
+        config = _make_minimal_config()
+        data_dir = tmp_path / "data"
+        data_dir.mkdir(parents=True)
+        (data_dir / "finished").mkdir()
+
+        _build_test_workbook(tmp_path, "a_success.xlsx")
+        _build_test_workbook(tmp_path, "b_no_invoice.xlsx", no_invoice_sheet=True)
+        (data_dir / "c_corrupt.xlsx").write_bytes(b"not valid xlsx")
+
+        serial = run_batch(config, data_dir)
+        parallel = run_batch(config, data_dir, jobs=2)
+
+        def _summary(result: Any) -> list[tuple[str, str, list[str]]]:
+            return [
+                (r.filename, r.status, [e.code for e in r.errors])
+                for r in result.file_results
+            ]
+
+        assert _summary(parallel) == _summary(serial)
+        assert parallel.failed_count == serial.failed_count
+
 
 # ---------------------------------------------------------------------------
 # Tests — process_file
@@ -341,6 +413,32 @@ class TestProcessFile:
         assert result.status in ("Success", "Attention", "Failed")
         assert result.filename == "vendor.xlsx"
 
+    def test_process_file_writes_output_to_given_finished_dir(
+        self, tmp_path: Path,
+    ) -> None:
+        """Verify the template is written under the finished_dir argument."""
+        config = _make_minimal_config()
+        filepath = tmp_path / "elsewhere" / "vendor.xlsx"
+        finished_dir = tmp_path / "data" / "finished"
+
+        def _fake_phase(ctx: Any) -> list[Any]:
+            ctx.invoice_items = []
+            ctx.packing_totals = PackingTotals(
+                total_nw=Decimal("1"), total_nw_precision=0,
+                total_gw=Decimal("2"), total_gw_precision=0,
+                total_packets=1,
+            )
+            return []
+
+        with (
+            patch("autoconvert.batch._PIPELINE", (_fake_phase,)),
+            patch("autoconvert.batch.write_template") as mock_write,
+        ):
+            result = process_file(filepath, config, finished_dir)
+
+        assert result.status == "Success"
+        assert mock_write.call_args.args[3] == finished_dir / "vendor_template.xlsx"
+
     def test_process_file_phase_short_circuit_sheet_detection(
         self, tmp_path: Path,
     ) -> None:
@@ -356,6 +454,23 @@ class TestProcessFile:
         assert any(e.code == ErrorCode.ERR_012 for e in result.errors)
         assert result.invoice_items is None
 
+    def test_process_file_late_phase_failure_drops_extracted_data(
+        self, tmp_path: Path,
+    ) -> None:
+        """Verify a failure after extraction returns no partial data."""
+        config = _make_minimal_config()
+        filepath = _build_test_workbook(tmp_path, "late_failure.xlsx")
+        failure = ProcessingError(code=ErrorCode.ERR_044, message="allocation failed")
+
+        with patch("autoconvert.batch.allocate_weights", side_effect=failure):
+            result = process_file(filepath, config)
+
+        assert result.status == "Failed"
+        assert any(e.code == ErrorCode.ERR_044 for e in result.errors)
+        assert result.invoice_items is None
+        assert result.packing_items is None
+        assert result.packing_totals is None
+
     def test_process_file_inv_no_fallback_fires_after_column_miss(
         self, tmp_path: Path,
     ) -> None:
@@ -459,6 +459,20 @@ class TestMapColumns:
         result = map_columns(wb.active, 10, "invoice", config)
         assert result.field_map["brand"] == 16
 
+    def test_map_columns_later_pattern_with_backreference(self) -> None:
+        """Any pattern of a field still matches, including back-references."""
+        config = _make_config("packing")
+        fields = dict(config.packing_columns)
+        fields["part_no"] = _make_field_pattern(
+            [r"(?i)part\s*no", r"^(\w)\1-code$"]
+        )
+        config = config.model_copy(update={"packing_columns": fields})
+        headers = {1: "XX-code", 2: "Qty", 3: "N.W.", 4: "G.W.", 5: "PO No", 6: "Pack"}
+        wb = _make_sheet({(10, col): h for col, h in headers.items()})
+
+        result = map_columns(wb.active, 10, "packing", config)
+        assert result.field_map["part_no"] == 1
+
 
 # ===========================================================================
 # Tests for extract_inv_no_from_header (FR-009)
@@ -489,6 +503,18 @@ class TestExtractInvNoFromHeader:
         result = extract_inv_no_from_header(wb.active, config)
         assert result == "PI240001"
 
+    def test_extract_inv_no_capture_beats_earlier_label(self) -> None:
+        """A capture-group hit on a later row wins over an earlier label."""
+        config = _make_config()
+        data: dict[tuple[int, int], object] = {}
+        data[(2, 1)] = "Invoice No:"
+        data[(2, 2)] = "LABEL-001"
+        data[(12, 3)] = "INVOICE NO.: CAP-002"
+        wb = _make_sheet(data)
+
+        result = extract_inv_no_from_header(wb.active, config)
+        assert result == "CAP-002"
+
     def test_extract_inv_no_label_below_row2(self) -> None:
         """Label at row 6; row+1=date (excluded); row+2=inv number."""
         config = _make_config()
@@ -8,6 +8,8 @@ template structure validation.
 from __future__ import annotations
 
 import re
+import shutil
+import zipfile
 from pathlib import Path
 from typing import Any
 
@@ -138,6 +140,18 @@ def _write_template_xlsx(
     return path
 
 
+def _set_dimension_tag(xlsx_path: Path, ref: str) -> None:
+    """Rewrite every worksheet's <dimension> tag, as a stale writer would."""
+    tmp_path = xlsx_path.with_suffix(".tmp")
+    with zipfile.ZipFile(xlsx_path) as zin, zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zout:
+        for item in zin.infolist():
+            data = zin.read(item.filename)
+            if item.filename.startswith("xl/worksheets/"):
+                data = re.sub(rb'<dimension ref="[^"]*" ?/>', f'<dimension ref="{ref}"/>'.encode(), data)
+            zout.writestr(item, data)
+    shutil.move(tmp_path, xlsx_path)
+
+
 def _create_full_config_dir(tmp_path: Path) -> Path:
     """Create a complete valid config directory with all four files."""
     config_dir = tmp_path / "config"
@@ -276,6 +290,39 @@ class TestLoadConfigYAML:
         assert exc_info.value.code == ErrorCode.ERR_004
         assert "invoice_columns" in exc_info.value.message
 
+    def test_load_config_missing_yaml_keys_listed_together(self, tmp_path: Path) -> None:
+        """Every missing top-level key is named in one ERR_004."""
+        config_dir = _create_full_config_dir(tmp_path)
+
+        yaml_data = _make_valid_yaml_data()
+        del yaml_data["inv_no_cell"]
+        del yaml_data["packing_sheet"]
+        _write_yaml(config_dir, yaml_data)
+
+        with pytest.raises(ConfigError) as exc_info:
+            load_config(config_dir)
+
+        assert exc_info.value.code == ErrorCode.ERR_004
+        assert "Missing required keys 'inv_no_cell', 'packing_sheet'" in exc_info.value.message
+
+    def test_load_config_yaml_sidecar_cache(self, tmp_path: Path) -> None:
+        """Parsed YAML is cached beside the file and invalidated on edit."""
+        config_dir = _create_full_config_dir(tmp_path)
+        sidecar = config_dir / "field_patterns.yaml.cache.json"
+
+        first = load_config(config_dir)
+        assert sidecar.is_file()
+        second = load_config(config_dir)
+        assert second.invoice_columns.keys() == first.invoice_columns.keys()
+
+        yaml_data = _make_valid_yaml_data()
+        del yaml_data["invoice_columns"]
+        _write_yaml(config_dir, yaml_data)
+
+        with pytest.raises(ConfigError) as exc_info:
+            load_config(config_dir)
+        assert exc_info.value.code == ErrorCode.ERR_004
+
     def test_load_config_malformed_column_entry(self, tmp_path: Path) -> None:
         """invoice_columns.part_no missing 'required' key raises ERR_004."""
         config_dir = _create_full_config_dir(tmp_path)
@@ -292,6 +339,21 @@ class TestLoadConfigYAML:
         assert "required" in exc_info.value.message
         assert "part_no" in exc_info.value.message
 
+    def test_load_config_missing_fields_listed_together(self, tmp_path: Path) -> None:
+        """All missing column fields are reported in one ERR_004."""
+        config_dir = _create_full_config_dir(tmp_path)
+
+        yaml_data = _make_valid_yaml_data()
+        del yaml_data["packing_columns"]["qty"]
+        del yaml_data["packing_columns"]["gw"]
+        _write_yaml(config_dir, yaml_data)
+
+        with pytest.raises(ConfigError) as exc_info:
+            load_config(config_dir)
+
+        assert exc_info.value.code == ErrorCode.ERR_004
+        assert "Missing fields 'gw', 'qty' in 'packing_columns'" in exc_info.value.message
+
 
 # ===========================================================================
 # Lookup table validation tests
@@ -337,6 +399,21 @@ class TestLoadConfigLookup:
         assert exc_info.value.code == ErrorCode.ERR_003
         assert "CHINA" in exc_info.value.message
 
+    def test_load_config_lookup_ignores_stale_dimension(self, tmp_path: Path) -> None:
+        """A lookup whose <dimension> tag understates its size loads every row."""
+        config_dir = _create_full_config_dir(tmp_path)
+        path = _write_lookup_xlsx(
+            config_dir,
+            "currency_rules.xlsx",
+            "Currency_Rules",
+            [(f"S{i}", i) for i in range(5)],
+        )
+        _set_dimension_tag(path, "A1:B3")
+
+        cfg = load_config(config_dir)
+
+        assert set(cfg.currency_lookup) == {"S0", "S1", "S2", "S3", "S4"}
+
     def test_load_config_country_int_target_code(self, tmp_path: Path) -> None:
         """Integer Target_Code (e.g., 142) is loaded successfully as str '142'."""
         config_dir = _create_full_config_dir(tmp_path)
@@ -391,6 +468,15 @@ class TestLoadConfigTemplate:
         assert exc_info.value.code == ErrorCode.ERR_005
         assert "40" in exc_info.value.message
 
+    def test_load_config_template_ignores_stale_dimension(self, tmp_path: Path) -> None:
+        """A template whose <dimension> tag understates its size still validates."""
+        config_dir = _create_full_config_dir(tmp_path)
+        _set_dimension_tag(config_dir / "output_template.xlsx", "A1:B2")
+
+        cfg = load_config(config_dir)
+
+        assert cfg.output_template_path.exists()
+
 
 # ===========================================================================
 # Happy path tests
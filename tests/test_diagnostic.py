@@ -33,6 +33,17 @@ class TestParseArgs:
         args = parse_args(["--diagnostic", "somefile.xlsx"])
         assert args.diagnostic == "somefile.xlsx"
 
+    def test_parse_args_jobs_default_and_value(self) -> None:
+        """Verify --jobs defaults to 1 and accepts a positive integer."""
+        assert parse_args([]).jobs == 1
+        assert parse_args(["--jobs", "4"]).jobs == 4
+
+    def test_parse_args_jobs_rejects_zero(self) -> None:
+        """Verify --jobs 0 is rejected with a usage error."""
+        with pytest.raises(SystemExit) as exc_info:
+            parse_args(["--jobs", "0"])
+        assert exc_info.value.code == 2
+
     def test_parse_args_version_flag(self) -> None:
         """Verify --version exits with code 0."""
         with pytest.raises(SystemExit) as exc_info:
@@ -97,7 +108,7 @@ class TestMain:
             patch("autoconvert.cli.parse_args", return_value=MagicMock(diagnostic=None)),
             patch("autoconvert.cli.setup_logging"),
             patch("autoconvert.cli.load_config", return_value=MagicMock()),
-            patch("autoconvert.cli.run_batch", return_value=batch_result),
+            patch("autoconvert.batch.run_batch", return_value=batch_result),
             patch("autoconvert.cli.print_batch_summary"),
             patch("autoconvert.cli.Path.cwd", return_value=tmp_path),
             pytest.raises(SystemExit) as exc_info,
@@ -116,7 +127,7 @@ class TestMain:
             patch("autoconvert.cli.parse_args", return_value=MagicMock(diagnostic=None)),
             patch("autoconvert.cli.setup_logging"),
             patch("autoconvert.cli.load_config", return_value=MagicMock()),
-            patch("autoconvert.cli.run_batch", return_value=batch_result),
+            patch("autoconvert.batch.run_batch", return_value=batch_result),
             patch("autoconvert.cli.print_batch_summary"),
             patch("autoconvert.cli.Path.cwd", return_value=tmp_path),
             pytest.raises(SystemExit) as exc_info,
@@ -147,7 +158,7 @@ class TestMain:
             patch("autoconvert.cli.setup_diagnostic_logging", mock_diag_logging),
             patch("autoconvert.cli.setup_logging") as mock_normal_logging,
             patch("autoconvert.cli.load_config", return_value=MagicMock()),
-            patch("autoconvert.cli.run_batch", return_value=batch_result),
+            patch("autoconvert.batch.run_batch", return_value=batch_result),
             patch("autoconvert.cli.print_batch_summary"),
             patch("autoconvert.cli.Path.cwd", return_value=tmp_path),
             pytest.raises(SystemExit),
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pickle
+
 import pytest
 
 from autoconvert.errors import ConfigError, ErrorCode, ProcessingError, WarningCode
@@ -53,6 +55,13 @@ def test_error_code_is_str_enum() -> None:
     assert ErrorCode.ERR_020 == "ERR_020"
 
 
+def test_codes_format_as_bare_value() -> None:
+    """str() and %-formatting give "ERR_020", not "ErrorCode.ERR_020"."""
+    assert str(ErrorCode.ERR_020) == "ERR_020"
+    assert "[%s]" % ErrorCode.ERR_020 == "[ERR_020]"
+    assert f"{WarningCode.ATT_002}" == "ATT_002"
+
+
 # ---------------------------------------------------------------------------
 # WarningCode
 # ---------------------------------------------------------------------------
@@ -118,6 +127,17 @@ def test_processing_error_uses_error_code_enum() -> None:
     assert err.code == "ERR_031"
 
 
+def test_processing_error_pickle_round_trip() -> None:
+    """ProcessingError keeps every field through pickle (process pool transport)."""
+    err = ProcessingError(ErrorCode.ERR_030, "msg", filename="f.xlsx", row=5, field="qty")
+    restored = pickle.loads(pickle.dumps(err))
+
+    assert isinstance(restored, ProcessingError)
+    assert (restored.code, restored.message, restored.filename, restored.row, restored.field) == (
+        ErrorCode.ERR_030, "msg", "f.xlsx", 5, "qty",
+    )
+
+
 # ---------------------------------------------------------------------------
 # ConfigError
 # ---------------------------------------------------------------------------
@@ -146,3 +166,14 @@ def test_config_error_is_exception_subclass() -> None:
     with pytest.raises(ConfigError) as exc_info:
         raise ConfigError("ERR_003", "missing key")
     assert exc_info.value.code == "ERR_003"
+
+
+def test_config_error_pickle_round_trip() -> None:
+    """ConfigError keeps code, message, and path through pickle."""
+    err = ConfigError(ErrorCode.ERR_004, "missing key", path="/config/x.yaml")
+    restored = pickle.loads(pickle.dumps(err))
+
+    assert (restored.code, restored.message, restored.path) == (
+        ErrorCode.ERR_004, "missing key", "/config/x.yaml",
+    )
+    assert not vars(restored)
@@ -0,0 +1,41 @@
+"""Tests for autoconvert.logger.
+
+Covers buffered file logging: records are held in memory until
+flush_log_handlers() writes them to the log file.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from autoconvert.logger import flush_log_handlers, setup_logging
+
+
+@pytest.fixture()
+def _restore_root_logger() -> Iterator[None]:
+    """Restore root handlers and level after a test reconfigures logging."""
+    handlers = list(logging.root.handlers)
+    level = logging.root.level
+    yield
+    for handler in logging.root.handlers:
+        handler.close()
+    logging.root.handlers[:] = handlers
+    logging.root.setLevel(level)
+
+
+@pytest.mark.usefixtures("_restore_root_logger")
+def test_file_records_written_on_flush(tmp_path: Path) -> None:
+    """DEBUG records are buffered, then written once flushed."""
+    log_path = tmp_path / "process_log.txt"
+    setup_logging(log_path)
+
+    logging.getLogger("autoconvert.test").debug("buffered line")
+    assert "buffered line" not in log_path.read_text(encoding="utf-8")
+
+    flush_log_handlers()
+
+    assert "[DEBUG] buffered line" in log_path.read_text(encoding="utf-8")
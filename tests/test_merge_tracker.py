@@ -158,6 +158,18 @@ class TestIsMergeAnchorAndIsInMerge:
 
         assert tracker.is_merge_anchor(10, 10) is False
 
+    def test_is_merge_continuation_only_non_anchor_cells(self) -> None:
+        """is_merge_continuation is True only for non-anchor cells in a range."""
+        sheet = _make_sheet()
+        sheet["B3"] = "anchor"
+        sheet.merge_cells("B3:D5")
+        tracker = MergeTracker(sheet)
+
+        assert tracker.is_merge_continuation(3, 2) is False  # anchor
+        assert tracker.is_merge_continuation(3, 3) is True   # same row
+        assert tracker.is_merge_continuation(5, 4) is True   # bottom-right
+        assert tracker.is_merge_continuation(6, 2) is False  # outside
+
 
 # ---------------------------------------------------------------------------
 # get_anchor_value
@@ -260,6 +260,23 @@ def test_write_template_fixed_columns_all_rows(tmp_path: Path) -> None:
         assert ws.cell(row=row, column=20).value == "142", f"T in row {row}"
 
 
+def test_write_template_reused_template_has_no_leftover_rows(tmp_path: Path) -> None:
+    """A second write from the same template must not carry rows from the first."""
+    template_path = tmp_path / "template.xlsx"
+    _make_template_workbook().save(template_path)
+    config = _make_app_config(template_path)
+    totals = _make_packing_totals()
+
+    first = [_make_invoice_item(part_no=f"P{i}") for i in range(3)]
+    write_template(first, totals, config, tmp_path / "first.xlsx")
+    write_template([_make_invoice_item(part_no="Q0")], totals, config, tmp_path / "second.xlsx")
+
+    ws = openpyxl.load_workbook(tmp_path / "second.xlsx")[_SHEET_NAME]
+    assert ws.max_row == 5
+    assert ws.cell(row=5, column=1).value == "Q0"
+    assert ws.cell(row=6, column=1).value is None
+
+
 def test_write_template_total_gw_and_packets_row5_only(tmp_path: Path) -> None:
     """total_gw (col P) and total_packets (col AK) are written to row 5 only."""
     template_path = tmp_path / "template.xlsx"
@@ -0,0 +1,176 @@
+"""Tests for autoconvert.sheet_snapshot.
+
+Verifies that a SheetSnapshot built from a read_only worksheet answers
+cell, number-format, dimension, and merged-range queries the same way the
+writable openpyxl Worksheet does after MergeTracker unmerging.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import openpyxl
+import pytest
+
+from autoconvert.merge_tracker import MergeTracker
+from autoconvert.sheet_snapshot import SheetSnapshot, WorkbookSnapshot
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _save_sample(tmp_path: Path) -> Path:
+    """Write a small workbook with values, a number format, and a merge.
+
+    Args:
+        tmp_path: Temporary directory path.
+
+    Returns:
+        Path to the saved .xlsx file.
+    """
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "Packing"
+    ws["A1"] = "Part No"
+    ws["B1"] = "N.W."
+    ws["A2"] = "P-001"
+    ws["B2"] = 1.5
+    ws["B2"].number_format = "0.00"
+    ws["C5"] = "far"
+    ws["A3"] = "merged"
+    ws.merge_cells("A3:A4")
+    path = tmp_path / "sample.xlsx"
+    wb.save(path)
+    return path
+
+
+def _snapshot(path: Path) -> SheetSnapshot:
+    """Open path read_only and return a snapshot of its first sheet.
+
+    Args:
+        path: Path to an .xlsx file.
+
+    Returns:
+        SheetSnapshot of the first worksheet.
+    """
+    wb = openpyxl.load_workbook(path, data_only=True, read_only=True)
+    try:
+        return SheetSnapshot.from_read_only(wb.worksheets[0])
+    finally:
+        wb.close()
+
+
+# ---------------------------------------------------------------------------
+# SheetSnapshot
+# ---------------------------------------------------------------------------
+
+
+class TestSheetSnapshot:
+    """Tests for SheetSnapshot.from_read_only and its Worksheet surface."""
+
+    def test_snapshot_reads_values_and_formats(self, tmp_path: Path) -> None:
+        """Values and number formats match the source cells."""
+        snap = _snapshot(_save_sample(tmp_path))
+
+        assert snap.title == "Packing"
+        assert snap.cell(row=1, column=1).value == "Part No"
+        assert snap.cell(row=2, column=2).value == 1.5
+        assert snap.cell(row=2, column=2).number_format == "0.00"
+        assert snap.cell(row=1, column=1).number_format == "General"
+
+    def test_snapshot_missing_cell_is_empty(self, tmp_path: Path) -> None:
+        """Cells absent from the XML read as None with General format."""
+        snap = _snapshot(_save_sample(tmp_path))
+
+        cell = snap.cell(row=99, column=99)
+        assert cell.value is None
+        assert cell.number_format == "General"
+
+    def test_snapshot_dimensions_match_writable_sheet(self, tmp_path: Path) -> None:
+        """max_row / max_column agree with the writable openpyxl sheet."""
+        path = _save_sample(tmp_path)
+        snap = _snapshot(path)
+        ws = openpyxl.load_workbook(path, data_only=True).worksheets[0]
+
+        assert (snap.max_row, snap.max_column) == (ws.max_row, ws.max_column)
+
+    def test_snapshot_iter_rows_matches_writable_sheet(self, tmp_path: Path) -> None:
+        """iter_rows(values_only=True) yields the same padded tuples."""
+        path = _save_sample(tmp_path)
+        snap = _snapshot(path)
+        ws = openpyxl.load_workbook(path, data_only=True).worksheets[0]
+        ws.unmerge_cells("A3:A4")
+
+        assert list(snap.iter_rows(values_only=True)) == list(
+            ws.iter_rows(values_only=True)
+        )
+        assert list(
+            snap.iter_rows(min_row=2, max_row=6, min_col=2, max_col=4, values_only=True)
+        ) == list(
+            ws.iter_rows(min_row=2, max_row=6, min_col=2, max_col=4, values_only=True)
+        )
+        first = next(snap.iter_rows(min_row=2, max_row=2))
+        assert first[1].number_format == "0.00"
+
+    def test_snapshot_dimensions_are_plain_attributes(self, tmp_path: Path) -> None:
+        """Dimensions are computed once at construction, not per access."""
+        snap = _snapshot(_save_sample(tmp_path))
+
+        assert isinstance(vars(snap)["max_row"], int)
+        assert isinstance(vars(snap)["max_column"], int)
+        assert not isinstance(
+            getattr(SheetSnapshot, "max_row", None), property
+        )
+
+    def test_snapshot_captures_merges_for_merge_tracker(self, tmp_path: Path) -> None:
+        """MergeTracker sees the merged range and the anchor value propagates."""
+        snap = _snapshot(_save_sample(tmp_path))
+
+        tracker = MergeTracker(snap)
+
+        assert tracker.is_merge_anchor(3, 1) is True
+        assert tracker.is_in_merge(4, 1) is True
+        assert snap.cell(row=4, column=1).value is None
+        assert tracker.get_anchor_value(snap, 4, 1) == "merged"
+
+    def test_snapshot_from_xlrd_sheet(self) -> None:
+        """xlrd rows become 1-based cells; empty strings read as None."""
+
+        class _FakeXlrdSheet:
+            name = "Invoice"
+            nrows = 2
+            ncols = 3
+
+            def row_values(self, r: int) -> list[object]:
+                return [["Part No", "", "Qty"], ["P-001", "", 10.0]][r]
+
+        snap = SheetSnapshot.from_xlrd(_FakeXlrdSheet())
+
+        assert snap.title == "Invoice"
+        assert (snap.max_row, snap.max_column) == (2, 3)
+        assert snap.cell(row=2, column=3).value == 10.0
+        assert snap.cell(row=1, column=2).value is None
+        assert snap.cell(row=2, column=1).number_format == "General"
+        assert snap.merged_cells.ranges == []
+
+
+# ---------------------------------------------------------------------------
+# WorkbookSnapshot
+# ---------------------------------------------------------------------------
+
+
+class TestWorkbookSnapshot:
+    """Tests for WorkbookSnapshot lookup surface."""
+
+    def test_workbook_snapshot_lookup(self, tmp_path: Path) -> None:
+        """worksheets, sheetnames, and name lookup agree; unknown names raise."""
+        snap = _snapshot(_save_sample(tmp_path))
+        wb = WorkbookSnapshot([snap])
+
+        assert wb.worksheets == [snap]
+        assert wb.sheetnames == ["Packing"]
+        assert wb["Packing"] is snap
+        with pytest.raises(KeyError):
+            wb["Invoice"]
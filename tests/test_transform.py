@@ -14,7 +14,12 @@ from pathlib import Path
 
 from autoconvert.errors import WarningCode
 from autoconvert.models import AppConfig, InvNoCellConfig, InvoiceItem
-from autoconvert.transform import clean_po_number, convert_country, convert_currency
+from autoconvert.transform import (
+    clean_po_number,
+    convert_country,
+    convert_currency,
+    transform_invoice_items,
+)
 
 # A do-nothing InvNoCellConfig used by _make_app_config.
 _EMPTY_INV_NO_CELL = InvNoCellConfig(
@@ -319,3 +324,48 @@ class TestCleanPoNumber:
         result = clean_po_number(items)
 
         assert result is not items
+
+
+# ---------------------------------------------------------------------------
+# transform_invoice_items (FR-018 + FR-019 + FR-020 fused)
+# ---------------------------------------------------------------------------
+
+
+class TestTransformInvoiceItems:
+    """Tests for the single-pass transform_invoice_items."""
+
+    def test_transform_invoice_items_matches_sequential(self) -> None:
+        """Result equals convert_currency -> convert_country -> clean_po_number."""
+        config = _make_app_config(
+            currency_lookup={"USD": "502"},
+            country_lookup={"CHINA": "142"},
+        )
+        items = [
+            _make_item(currency="usd", coo="China", po_no="2250600556-2.1"),
+            _make_item(currency="XYZ", coo="Narnia", po_no="-PO1"),
+            _make_item(currency="USD", coo="Atlantis", po_no="PO32741.0"),
+        ]
+
+        seq_items, seq_warnings = convert_currency(items, config)
+        seq_items, coo_warnings = convert_country(seq_items, config)
+        seq_items = clean_po_number(seq_items)
+
+        result, warnings = transform_invoice_items(items, config)
+
+        assert result == seq_items
+        assert [w.code for w in warnings] == [
+            w.code for w in seq_warnings + coo_warnings
+        ]
+        assert [w.code for w in warnings] == [
+            WarningCode.ATT_003, WarningCode.ATT_004, WarningCode.ATT_004,
+        ]
+
+    def test_transform_invoice_items_does_not_mutate_input(self) -> None:
+        """Side-effect rule: original items keep their raw values."""
+        config = _make_app_config(currency_lookup={"USD": "502"})
+        original = _make_item(currency="USD", po_no="PO1-2")
+
+        transform_invoice_items([original], config)
+
+        assert original.currency == "USD"
+        assert original.po_no == "PO1-2"
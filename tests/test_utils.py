@@ -13,6 +13,7 @@ from autoconvert.utils import (
     FOOTER_KEYWORDS,
     PLACEHOLDER_PATTERN,
     detect_cell_precision,
+    has_stop_keyword,
     is_cell_empty,
     is_placeholder,
     is_stop_keyword,
@@ -377,6 +378,18 @@ def test_is_stop_keyword_negative_hello() -> None:
     assert is_stop_keyword("hello") is False
 
 
+def test_has_stop_keyword_row_values() -> None:
+    """Any string cell in the row matches; non-strings are ignored."""
+    assert has_stop_keyword([None, 12.5, "PN-1", "Grand Total"]) is True
+    assert has_stop_keyword(["PN-1", 3, None, "USD"]) is False
+    assert has_stop_keyword([]) is False
+
+
+def test_has_stop_keyword_no_match_across_cells() -> None:
+    """Adjacent cells are not joined into a keyword ('to' + 'tal')."""
+    assert has_stop_keyword(["to", "tal"]) is False
+
+
 # ===========================================================================
 # DITTO_MARKS constant
 # ===========================================================================